@@ -0,0 +1,145 @@
+if __name__ == "__main__":
+    raise RuntimeError("backup_store.py should not be run directly!")
+
+import datetime
+import hashlib
+import json
+import os
+import zlib
+
+LEGACY_MARKER = "_backup_"
+
+
+class BackupStore:
+    """Deduplicated, zlib-compressed backups of the save's JSON files.
+
+    Each snapshot is stored once under objects/<sha256>.zlib and listed in index.json,
+    so an unchanged file costs nothing to back up and the restore menu never has to
+    scan the folder or open a backup just to list it.
+    """
+
+    def __init__(self, backup_dir):
+        self.backup_dir = backup_dir
+        self.objects_dir = os.path.join(backup_dir, "objects")
+        self.index_file = os.path.join(backup_dir, "index.json")
+        self._index = None
+
+    def _load_index(self):
+        if self._index is not None:
+            return self._index
+
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+                return self._index
+            except (json.JSONDecodeError, OSError):
+                print("⚠️  Backup index unreadable, rebuilding from legacy backups...")
+
+        self._index = {"snapshots": []}
+        self._ingest_legacy_backups()
+        return self._index
+
+    def _save_index(self):
+        os.makedirs(self.backup_dir, exist_ok=True)
+        tmp_file = self.index_file + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, indent=2)
+        os.replace(tmp_file, self.index_file)
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, f"{digest}.zlib")
+
+    def _write_object(self, payload):
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(self.objects_dir, exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(zlib.compress(payload, 6))
+            os.replace(tmp_path, path)
+        return digest
+
+    def _ingest_legacy_backups(self):
+        """Fold old <kind>_backup_<timestamp>.json files into the store, oldest first"""
+        if not os.path.isdir(self.backup_dir):
+            return
+
+        legacy = sorted(
+            (f for f in os.listdir(self.backup_dir) if LEGACY_MARKER in f and f.endswith(".json")),
+            key=lambda f: f.split(LEGACY_MARKER)[1]
+        )
+        if not legacy:
+            return
+
+        for filename in legacy:
+            kind, timestamp = filename[:-len(".json")].split(LEGACY_MARKER, 1)
+            path = os.path.join(self.backup_dir, filename)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                continue
+            self._add(kind, data, timestamp)
+            os.remove(path)
+
+        self._save_index()
+
+    def _add(self, kind, data, timestamp, meta=None):
+        payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        digest = hashlib.sha256(payload).hexdigest()
+
+        latest = next((s for s in reversed(self._index["snapshots"]) if s["kind"] == kind), None)
+        if latest and latest["hash"] == digest:
+            return None
+
+        self._write_object(payload)
+        snapshot = {"kind": kind, "timestamp": timestamp, "hash": digest, "size": len(payload)}
+        snapshot.update(meta or {})
+        self._index["snapshots"].append(snapshot)
+        return snapshot
+
+    def add(self, kind, data, max_backups=20, meta=None):
+        """Back up data under kind; returns the new snapshot, or None if it matches the latest one.
+
+        meta is stored on the snapshot's index entry, so it can be read without loading the backup."""
+        self._load_index()
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        snapshot = self._add(kind, data, timestamp, meta)
+        if snapshot is None:
+            return None
+
+        self._prune(kind, max_backups)
+        self._save_index()
+        return snapshot
+
+    def _prune(self, kind, max_backups):
+        snapshots = self._index["snapshots"]
+        of_kind = [s for s in snapshots if s["kind"] == kind]
+        if len(of_kind) <= max_backups:
+            return
+
+        dropped = of_kind[:-max_backups]
+        dropped_ids = {id(s) for s in dropped}
+        self._index["snapshots"] = [s for s in snapshots if id(s) not in dropped_ids]
+
+        still_used = {s["hash"] for s in self._index["snapshots"]}
+        for s in dropped:
+            if s["hash"] not in still_used:
+                try:
+                    os.remove(self._object_path(s["hash"]))
+                except OSError:
+                    pass
+
+    def snapshots(self, kind):
+        """Snapshots of one kind, most recent first"""
+        return [s for s in reversed(self._load_index()["snapshots"]) if s["kind"] == kind]
+
+    def history(self, kinds):
+        """Snapshots of any of the given kinds, most recent first"""
+        return [s for s in reversed(self._load_index()["snapshots"]) if s["kind"] in kinds]
+
+    def load(self, snapshot):
+        with open(self._object_path(snapshot["hash"]), "rb") as f:
+            return json.loads(zlib.decompress(f.read()).decode("utf-8"))
\ No newline at end of file
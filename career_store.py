@@ -0,0 +1,298 @@
+if __name__ == "__main__":
+    raise RuntimeError("career_store.py should not be run directly!")
+
+import bisect
+import datetime
+import json
+import os
+import sqlite3
+from array import array
+
+CAREER_FIELDS = [
+    "earnings",
+    "kills",
+    "tournaments",
+    "wins",
+    "cashcup_wins",
+    "elite_series_wins",
+    "reload_wins",
+    "fncs_wins",
+    "lan_wins",
+    "victorycup_wins",
+    "best_finish",
+]
+
+CAREER_DEFAULTS = {field: 0 for field in CAREER_FIELDS}
+CAREER_DEFAULTS["best_finish"] = 999
+
+SQLITE_MAX_VARIABLES = 900
+SORTABLE_FIELDS = ["earnings", "kills", "wins", "tournaments"]
+
+# Filled from TOURNAMENT_TYPES by register_achievement_types; a type's code is its index here
+ACHIEVEMENT_TYPES = []
+UNKNOWN_TYPE = "UNKNOWN"
+UNKNOWN_TYPE_CODE = 255
+PLACEMENT_SCORES = {1: 100, 2: 85, 3: 70, 4: 55, 5: 40}
+TYPE_MULTIPLIERS = {
+    "LAN": 4,
+    "FNCS": 3,
+    "ELITE_SERIES": 2,
+    "RELOAD": 1.5,
+    "CASH_CUP": 1.0,
+    "VICTORY_CUP": 0.5
+}
+
+
+def achievement_weight(placement, t_type):
+    score = PLACEMENT_SCORES.get(placement, max(0, 40 - (placement - 5) * 2))
+    return score * TYPE_MULTIPLIERS.get(t_type, 1.0)
+
+
+def register_achievement_types(types):
+    """Give each tournament type an achievement code. Codes are stored, so new types only ever go on the end"""
+    for t_type in types:
+        if t_type not in ACHIEVEMENT_TYPES:
+            ACHIEVEMENT_TYPES.append(t_type)
+
+
+def achievement_type_code(t_type):
+    if t_type in ACHIEVEMENT_TYPES:
+        return ACHIEVEMENT_TYPES.index(t_type)
+    return UNKNOWN_TYPE_CODE
+
+
+def achievement_type_name(code):
+    return ACHIEVEMENT_TYPES[code] if code < len(ACHIEVEMENT_TYPES) else UNKNOWN_TYPE
+
+
+class AchievementLog:
+    """A player's top-10 finishes as parallel arrays (placement, type code, day ordinal, earnings).
+
+    Per-placement counts and the best few highlights are kept up to date on append,
+    so the GOAT index and career highlights never have to rescan the log.
+    """
+
+    HIGHLIGHTS = 6
+
+    def __init__(self):
+        self.placements = array("B")
+        self.types = array("B")
+        self.days = array("I")
+        self.earnings = array("Q")
+        self.placement_counts = [0] * 11
+        self._highlights = []
+
+    @classmethod
+    def from_data(cls, data):
+        """Build a log from stored columns or from the old list of achievement dicts"""
+        if isinstance(data, cls):
+            return data
+
+        log = cls()
+        if isinstance(data, dict):
+            for placement, code, day, earned in zip(data["placement"], data["type"], data["day"], data["earnings"]):
+                log._append(placement, code, day, earned)
+        else:
+            for a in data:
+                log.append(a["placement"], a["type"], a["date"], a.get("earnings", 0))
+        return log
+
+    def _append(self, placement, code, day, earned):
+        index = len(self.placements)
+        self.placements.append(placement)
+        self.types.append(code)
+        self.days.append(day)
+        self.earnings.append(earned)
+        self.placement_counts[min(placement, 10)] += 1
+
+        key = (-achievement_weight(placement, achievement_type_name(code)), index)
+        if len(self._highlights) < self.HIGHLIGHTS or key < self._highlights[-1]:
+            bisect.insort(self._highlights, key)
+            del self._highlights[self.HIGHLIGHTS:]
+
+    def append(self, placement, t_type, date, earned):
+        day = datetime.date.fromisoformat(date).toordinal()
+        self._append(placement, achievement_type_code(t_type), day, earned)
+
+    def __len__(self):
+        return len(self.placements)
+
+    def __getitem__(self, index):
+        return {
+            "placement": self.placements[index],
+            "type": achievement_type_name(self.types[index]),
+            "date": datetime.date.fromordinal(self.days[index]).isoformat(),
+            "earnings": self.earnings[index]
+        }
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def count_top(self, n):
+        """How many finishes were top n or better"""
+        return sum(self.placement_counts[1:min(n, 10) + 1])
+
+    def highlights(self, limit=HIGHLIGHTS):
+        """The best finishes by placement and tournament weight, earliest first on ties"""
+        if limit > self.HIGHLIGHTS:
+            achievements = list(self)
+            return sorted(achievements, key=lambda a: achievement_weight(a["placement"], a["type"]), reverse=True)[:limit]
+        return [self[index] for _, index in self._highlights[:limit]]
+
+    def to_columns(self):
+        return {
+            "placement": self.placements.tolist(),
+            "type": self.types.tolist(),
+            "day": self.days.tolist(),
+            "earnings": self.earnings.tolist()
+        }
+
+    def to_list(self):
+        return list(self)
+
+
+class CareerStore:
+    """Career stats in SQLite, one row per player per region.
+
+    Rows go in and out in the same dict layout career_stats.json always used
+    ({name: {"earnings": ..., "achievements": [...]}}), so JSON files can still be
+    imported and exported as-is.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            columns = ", ".join(f"{field} INTEGER NOT NULL DEFAULT {CAREER_DEFAULTS[field]}" for field in CAREER_FIELDS)
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS careers ("
+                f"region TEXT NOT NULL, name TEXT NOT NULL, {columns}, "
+                f"achievements TEXT NOT NULL DEFAULT '[]', "
+                f"PRIMARY KEY (region, name))"
+            )
+            for field in SORTABLE_FIELDS:
+                self._conn.execute(f"CREATE INDEX IF NOT EXISTS careers_by_{field} ON careers (region, {field} DESC)")
+            self._conn.commit()
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _row_to_stats(self, row):
+        stats = dict(zip(CAREER_FIELDS, row[1:-1]))
+        stats["achievements"] = AchievementLog.from_data(json.loads(row[-1]))
+        return row[0], stats
+
+    def load(self, region, names):
+        """Career rows for just the given players, keyed by name"""
+        conn = self._connect()
+        names = list(names)
+        columns = ", ".join(["name"] + CAREER_FIELDS + ["achievements"])
+        data = {}
+
+        for i in range(0, len(names), SQLITE_MAX_VARIABLES):
+            chunk = names[i:i + SQLITE_MAX_VARIABLES]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT {columns} FROM careers WHERE region = ? AND name IN ({placeholders})",
+                [region, *chunk]
+            )
+            for row in rows:
+                name, stats = self._row_to_stats(row)
+                data[name] = stats
+
+        return data
+
+    def _write_rows(self, conn, region, data):
+        columns = CAREER_FIELDS + ["achievements"]
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns)
+        sql = (
+            f"INSERT INTO careers (region, name, {', '.join(columns)}) "
+            f"VALUES (?, ?, {', '.join('?' * len(columns))}) "
+            f"ON CONFLICT (region, name) DO UPDATE SET {updates}"
+        )
+
+        rows = []
+        for name, stats in data.items():
+            values = [stats.get(field, CAREER_DEFAULTS[field]) for field in CAREER_FIELDS]
+            achievements = AchievementLog.from_data(stats.get("achievements", []))
+            rows.append((region, name, *values, json.dumps(achievements.to_columns(), separators=(",", ":"))))
+        conn.executemany(sql, rows)
+
+    def upsert(self, region, data):
+        """Write the given players' rows in one transaction, leaving everyone else untouched"""
+        conn = self._connect()
+        with conn:
+            self._write_rows(conn, region, data)
+
+    def export_json(self, region):
+        """Every career row for the region in the career_stats.json layout"""
+        conn = self._connect()
+        columns = ", ".join(["name"] + CAREER_FIELDS + ["achievements"])
+        rows = conn.execute(f"SELECT {columns} FROM careers WHERE region = ? ORDER BY name", (region,))
+        data = {}
+        for row in rows:
+            name, stats = self._row_to_stats(row)
+            stats["achievements"] = stats["achievements"].to_list()
+            data[name] = stats
+        return data
+
+    def import_json(self, region, data):
+        """Replace the region's careers with a career_stats.json style dict"""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM careers WHERE region = ?", (region,))
+            self._write_rows(conn, region, data)
+
+    def import_json_file(self, region, path):
+        """Import a legacy career_stats.json and move it aside so it is only imported once"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"⚠️  Could not import {path}: {e}")
+            return False
+
+        self.import_json(region, data)
+        os.replace(path, path.replace(".json", ".migrated.json"))
+        return True
+
+    def _filter(self, region, name_filter):
+        if name_filter:
+            return "WHERE region = ? AND name LIKE ? ESCAPE '\\'", [region, f"%{_escape_like(name_filter)}%"]
+        return "WHERE region = ?", [region]
+
+    def count(self, region, name_filter=None):
+        where, params = self._filter(region, name_filter)
+        return self._connect().execute(f"SELECT COUNT(*) FROM careers {where}", params).fetchone()[0]
+
+    def page(self, region, order_by="earnings", offset=0, limit=20, name_filter=None):
+        """One page of the region's careers, best first, as (name, stats) pairs.
+
+        Only the requested rows are read, so browsing every player who ever appeared
+        costs the same as browsing a single lobby."""
+        if order_by not in SORTABLE_FIELDS:
+            raise ValueError(f"Cannot sort careers by {order_by!r}")
+
+        where, params = self._filter(region, name_filter)
+        columns = ", ".join(["name"] + CAREER_FIELDS + ["achievements"])
+        rows = self._connect().execute(
+            f"SELECT {columns} FROM careers {where} ORDER BY {order_by} DESC, name LIMIT ? OFFSET ?",
+            [*params, limit, offset]
+        )
+        return [self._row_to_stats(row) for row in rows]
+
+    def tournaments_played(self, region):
+        conn = self._connect()
+        row = conn.execute("SELECT MAX(tournaments) FROM careers WHERE region = ?", (region,)).fetchone()
+        return row[0] or 0
+
+
+def _escape_like(text):
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
\ No newline at end of file
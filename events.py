@@ -0,0 +1,239 @@
+if __name__ == "__main__":
+    raise RuntimeError("events.py should not be run directly!")
+
+import json
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from typing import List
+from utils import display_name, Colors, sim_sleep, sim_print
+
+
+@dataclass
+class MatchEvent:
+    match: int
+
+    kind = "event"
+
+    def to_dict(self):
+        """Plain data version of the event, with players replaced by their names"""
+        data = {"type": self.kind}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if isinstance(value, list):
+                value = [getattr(v, "name", v) for v in value]
+            data[f.name] = getattr(value, "name", value)
+        return data
+
+
+@dataclass
+class MatchStartEvent(MatchEvent):
+    players: list
+    kind = "match_start"
+
+
+@dataclass
+class KillEvent(MatchEvent):
+    killer: object
+    victim: object
+    placement: int
+    lightning: bool = False
+    out_of_reboots: bool = False
+    kind = "kill"
+
+
+@dataclass
+class RebootEvent(MatchEvent):
+    killer: object
+    victim: object
+    reboots_left: int
+    kind = "reboot"
+
+
+@dataclass
+class CrashEvent(MatchEvent):
+    player: object
+    kind = "crash"
+
+
+@dataclass
+class NoLoadEvent(MatchEvent):
+    player: object
+    kind = "no_load"
+
+
+@dataclass
+class EmoteEvent(MatchEvent):
+    killer: object
+    victim: object
+    style: int
+    kind = "emote"
+
+
+@dataclass
+class RageQuitEvent(MatchEvent):
+    player: object
+    bad_games: int
+    average_badness: float
+    kind = "rage_quit"
+
+
+@dataclass
+class VictoryEvent(MatchEvent):
+    winner: object
+    kills: int
+    placement_points: int
+    total_points: int
+    commentary: str
+    kind = "victory"
+
+
+EMOTE_LINES = [
+    "💀 {killer} hits the emote on {victim}!",
+    "🕺 {killer} is dancing... {victim} won't forget that.",
+    "😤 {killer} with the disrespectful emote on {victim}!",
+]
+
+
+class EventBus:
+    """Fans match events out to whoever is subscribed; with no subscribers nothing is built or sent"""
+
+    def __init__(self):
+        self._subscribers = []
+
+    @property
+    def active(self):
+        return bool(self._subscribers)
+
+    def subscribe(self, subscriber):
+        self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+
+    @contextmanager
+    def subscribed(self, *subscribers):
+        for subscriber in subscribers:
+            self.subscribe(subscriber)
+        try:
+            yield
+        finally:
+            for subscriber in subscribers:
+                self.unsubscribe(subscriber)
+
+    def emit(self, event: MatchEvent):
+        for subscriber in self._subscribers:
+            subscriber(event)
+
+
+EVENT_BUS = EventBus()
+
+
+class KillfeedRenderer:
+    """The classic colored killfeed, drawn from the event stream"""
+
+    def __init__(self, highlights=False):
+        self.highlights = highlights
+        self._top5_names = set()
+
+    def __call__(self, event: MatchEvent):
+        handler = getattr(self, f"on_{event.kind}", None)
+        if handler:
+            handler(event)
+
+    def _name(self, p):
+        base = display_name(p)
+        if self.highlights and p.name in self._top5_names:
+            return f"{Colors.SOFT_GOLD}{base}{Colors.RESET}"
+        return base
+
+    def on_match_start(self, event: MatchStartEvent):
+        leaders = sorted(event.players, key=lambda p: p.total_points, reverse=True)[:5]
+        self._top5_names = {p.name for p in leaders}
+
+    def on_kill(self, event: KillEvent):
+        emoji = "🌩️" if event.lightning else "⚔️"
+        reboot_msg = f" {Colors.SOFT_RED}(OUT OF REBOOTS){Colors.RESET}" if event.out_of_reboots else ""
+        sim_print(
+            f"{self._name(event.killer)} {emoji} {self._name(event.victim)} {Colors.LIGHT_GRAY}(Placement: {event.placement}){reboot_msg}{Colors.RESET}")
+
+    def on_reboot(self, event: RebootEvent):
+        sim_print(
+            f"{self._name(event.killer)} 🔄 {self._name(event.victim)} {Colors.SOFT_GREEN}(REBOOTED! {event.reboots_left} left){Colors.RESET}")
+
+    def on_crash(self, event: CrashEvent):
+        sim_print(f"💥 {Colors.SOFT_RED}{display_name(event.player)} crashed! {Colors.RESET}")
+
+    def on_no_load(self, event: NoLoadEvent):
+        sim_print(f"❌ {Colors.SOFT_RED}{display_name(event.player)} didn't load in! {Colors.RESET}")
+
+    def on_emote(self, event: EmoteEvent):
+        line = EMOTE_LINES[event.style].format(killer=display_name(event.killer), victim=display_name(event.victim))
+        sim_print(f"{Colors.ITALIC}{line}{Colors.RESET}")
+
+    def on_rage_quit(self, event: RageQuitEvent):
+        sim_print(f"{Colors.SOFT_RED + Colors.BOLD}😡 {display_name(event.player)} RAGE QUIT the tournament!{Colors.RESET}")
+        sim_print(f"   └─ Tilted after {event.bad_games} bad games (avg: {event.average_badness:.1f})")
+        sim_sleep(1.5)
+
+    def on_victory(self, event: VictoryEvent):
+        sim_print("\n" + "━" * 50)
+        sim_print(f"🟩🟩🟩 #1 VICTORY ROYALE - GAME {event.match} 🟩🟩🟩")
+        sim_print("━" * 50)
+        sim_sleep(1)
+
+        sim_print(f"\n🏆 {display_name(event.winner)}")
+        sim_sleep(0.5)
+        sim_print(f"• Match Kills: {event.kills}")
+        sim_sleep(0.5)
+        sim_print(f"• Placement Points: {event.placement_points}")
+        sim_sleep(0.5)
+        sim_print(f"• Total Points: {event.total_points}")
+        sim_sleep(1)
+
+        sim_print(f"\n👑 {Colors.ITALIC}{event.commentary}{Colors.RESET}\n")
+        sim_sleep(1)
+        sim_print("━" * 50)
+        sim_sleep(1)
+
+
+class EventCollector:
+    """Keeps every event in memory"""
+
+    def __init__(self):
+        self.events: List[MatchEvent] = []
+
+    def __call__(self, event: MatchEvent):
+        self.events.append(event)
+
+
+class EventCounter:
+    """Counts events by type and keeps nothing else"""
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def __call__(self, event: MatchEvent):
+        self.counts[event.kind] += 1
+
+
+class JsonlEventWriter:
+    """Appends each event as one JSON line"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __call__(self, event: MatchEvent):
+        self._file.write(json.dumps(event.to_dict(), ensure_ascii=False) + "\n")
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
\ No newline at end of file
@@ -1,35 +1,55 @@
+import atexit
+import csv
+import gzip
 import json
 import os
 import math
 import random
 import time
 import datetime
+import copy
+import multiprocessing
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import List
 from utils import display_name, ORG_TAGS, Colors, sim_sleep, DEFAULT_CONFIG, CONFIG, BASE_DIR, DATA_DIR, save_config, \
-    load_config, save_active_mods, load_active_mods
+    load_config, save_active_mods, load_active_mods, sim_print, is_headless, headless_mode, WeightedSampler
+from career_store import CareerStore, AchievementLog, SORTABLE_FIELDS, register_achievement_types
+from backup_store import BackupStore
+from persistence import BackgroundWriter
+from tournament_archive import TournamentArchive
 from rich.console import Console
 from rich.table import Table
+try:
+    import numpy as np
+except ImportError:
+    np = None
+from events import (
+    EVENT_BUS,
+    EMOTE_LINES,
+    KillfeedRenderer,
+    MatchStartEvent,
+    KillEvent,
+    RebootEvent,
+    CrashEvent,
+    NoLoadEvent,
+    EmoteEvent,
+    VictoryEvent,
+)
 from mods import (
-    TechnicalIssuesMod,
-    RageQuitMod,
-    ZeroBuildFlashbackMod,
-    StreamSnipedMod,
-    PingDiffMod,
-    ClutchFactorMod,
+    HookRegistry,
+    FightModifiers,
+    ModProfiler,
+    load_mod_manifest,
 )
 
 console = Console(highlight=False)
 
-ACTIVE_MODS = [
-    TechnicalIssuesMod(crash_chance=0.008, no_load_chance=0.012),
-    RageQuitMod(),
-    ZeroBuildFlashbackMod(),
-    StreamSnipedMod(),
-    ClutchFactorMod(),
-]
-
-ACTIVE_MODS = load_active_mods(ACTIVE_MODS)
+ACTIVE_MODS = load_active_mods(load_mod_manifest())
+MOD_HOOKS = HookRegistry(ACTIVE_MODS)
+MOD_PROFILER = ModProfiler()
+MOD_PROFILE_FILE = os.path.join(DATA_DIR, "mod_profile.json")
 
 TOURNAMENTS_ROOT = os.path.join(BASE_DIR, "tournaments")
 
@@ -38,7 +58,19 @@ REGION_DATA_DIR = os.path.join(DATA_DIR, REGION)
 os.makedirs(REGION_DATA_DIR, exist_ok=True)
 CAREER_FILE = os.path.join(REGION_DATA_DIR, "career_stats.json")
 SEASON_FILE = os.path.join(REGION_DATA_DIR, "season_data.json")
+SEASON_JOURNAL_FILE = os.path.join(REGION_DATA_DIR, "season_journal.jsonl")
 SOCIAL_FILE = os.path.join(REGION_DATA_DIR, "social_data.json")
+CAREER_STORE = CareerStore(os.path.join(DATA_DIR, "career.sqlite3"))
+WRITER = BackgroundWriter()
+EXIT_FLUSH_TIMEOUT = 60
+
+
+def _flush_on_exit():
+    if not WRITER.flush(timeout=EXIT_FLUSH_TIMEOUT):
+        print("⚠️  Saves were still being written at exit and may be incomplete")
+
+
+atexit.register(_flush_on_exit)
 SPLASH_FILE = "splash.txt"
 SEASON = {
     "current_season": 1,
@@ -74,6 +106,106 @@ def get_save_path(save_name):
     return os.path.join(SAVES_DIR, save_name)
 
 
+SAVE_MANIFEST = "save_manifest.json"
+
+
+def _scan_save_info(save_path):
+    """Work out a save's regions, tournament counts and seasons by reading its data files"""
+    info = {
+        "regions": {},
+        "last_played": "Never"
+    }
+
+    career_db = os.path.join(save_path, "career.sqlite3")
+    save_store = CareerStore(career_db) if os.path.exists(career_db) else None
+
+    for region in ["eu", "na", "br", "oce", "mixed"]:
+        region_dir = os.path.join(save_path, region)
+        career_file = os.path.join(region_dir, "career_stats.json")
+        season_file = os.path.join(region_dir, "season_data.json")
+        journal_file = os.path.join(region_dir, "season_journal.jsonl")
+        played_files = [f for f in (season_file, journal_file) if os.path.exists(f)]
+
+        if os.path.exists(career_file) or played_files:
+            region_info = {
+                "tournaments": 0,
+                "season": 1,
+                "last_played": "Never"
+            }
+
+            if save_store and not os.path.exists(career_file):
+                try:
+                    region_info["tournaments"] = save_store.tournaments_played(region)
+                except sqlite3.Error:
+                    pass
+            elif os.path.exists(career_file):
+                try:
+                    with open(career_file, "r") as f:
+                        career_data = json.load(f)
+                        if career_data:
+                            first_player = list(career_data.values())[0]
+                            region_info["tournaments"] = first_player.get("tournaments", 0)
+                except:
+                    pass
+
+            if os.path.exists(season_file):
+                try:
+                    with open(season_file, "r") as f:
+                        season_data = json.load(f)
+                        region_info["season"] = season_data.get("current_season", 1)
+                except:
+                    pass
+
+            if played_files:
+                mtime = max(os.path.getmtime(f) for f in played_files)
+                region_info["last_played"] = datetime.datetime.fromtimestamp(mtime).strftime(
+                    "%Y-%m-%d %H:%M")
+
+            info["regions"][region.upper()] = region_info
+
+    if save_store:
+        save_store.close()
+
+    if info["regions"]:
+        most_recent = max(
+            info["regions"].values(),
+            key=lambda x: x["last_played"]
+        )
+        info["last_played"] = most_recent["last_played"]
+
+    return info
+
+
+def read_save_manifest(save_path):
+    try:
+        with open(os.path.join(save_path, SAVE_MANIFEST), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def write_save_manifest(save_path, info):
+    with open(os.path.join(save_path, SAVE_MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(info, f, indent=2)
+
+
+def update_save_manifest(save_path):
+    """Refresh the manifest entry for the region that was just played"""
+    info = read_save_manifest(save_path) or _scan_save_info(save_path)
+
+    played_files = [f for f in (SEASON_FILE, SEASON_JOURNAL_FILE) if os.path.exists(f)]
+    if played_files:
+        mtime = max(os.path.getmtime(f) for f in played_files)
+        info["regions"][REGION.upper()] = {
+            "tournaments": CAREER_STORE.tournaments_played(REGION),
+            "season": SEASON.get("current_season", 1),
+            "last_played": datetime.datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
+        }
+        info["last_played"] = max(r["last_played"] for r in info["regions"].values())
+
+    write_save_manifest(save_path, info)
+
+
 def list_saves():
     """List all available saves with their info"""
     saves = []
@@ -83,56 +215,11 @@ def list_saves():
     for save_name in os.listdir(SAVES_DIR):
         save_path = get_save_path(save_name)
         if os.path.isdir(save_path):
-            info = {
-                "name": save_name,
-                "regions": {},
-                "last_played": "Never"
-            }
-
-            for region in ["eu", "na", "br", "oce", "mixed"]:
-                region_dir = os.path.join(save_path, region)
-                career_file = os.path.join(region_dir, "career_stats.json")
-                season_file = os.path.join(region_dir, "season_data.json")
-
-                if os.path.exists(career_file) or os.path.exists(season_file):
-                    region_info = {
-                        "tournaments": 0,
-                        "season": 1,
-                        "last_played": "Never"
-                    }
-
-                    if os.path.exists(career_file):
-                        try:
-                            with open(career_file, "r") as f:
-                                career_data = json.load(f)
-                                if career_data:
-                                    first_player = list(career_data.values())[0]
-                                    region_info["tournaments"] = first_player.get("tournaments", 0)
-                        except:
-                            pass
-
-                    if os.path.exists(season_file):
-                        try:
-                            with open(season_file, "r") as f:
-                                season_data = json.load(f)
-                                region_info["season"] = season_data.get("current_season", 1)
-
-                            mtime = os.path.getmtime(season_file)
-                            region_info["last_played"] = datetime.datetime.fromtimestamp(mtime).strftime(
-                                "%Y-%m-%d %H:%M")
-                        except:
-                            pass
-
-                    info["regions"][region.upper()] = region_info
-
-            if info["regions"]:
-                most_recent = max(
-                    info["regions"].values(),
-                    key=lambda x: x["last_played"]
-                )
-                info["last_played"] = most_recent["last_played"]
-
-            saves.append(info)
+            info = read_save_manifest(save_path)
+            if info is None:
+                info = _scan_save_info(save_path)
+                write_save_manifest(save_path, info)
+            saves.append({"name": save_name, **info})
 
     return sorted(saves, key=lambda x: x["last_played"], reverse=True)
 
@@ -147,9 +234,54 @@ def create_save(save_name):
     return True, "Save created successfully"
 
 
+SYNC_SKIP = {"current_save.txt", SAVE_MANIFEST}
+
+
+def _same_file(src_stat, dst_path):
+    try:
+        dst_stat = os.stat(dst_path)
+    except FileNotFoundError:
+        return False
+    return dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime_ns == src_stat.st_mtime_ns
+
+
+def sync_tree(src_dir, dst_dir, skip=SYNC_SKIP):
+    """Mirror src_dir into dst_dir, copying only files whose size or mtime changed
+    and removing anything src_dir no longer has. Returns the number of files copied."""
+    import shutil
+    os.makedirs(dst_dir, exist_ok=True)
+    copied = 0
+
+    with os.scandir(src_dir) as entries:
+        src_entries = {entry.name: entry for entry in entries if entry.name not in skip}
+
+    for name in os.listdir(dst_dir):
+        if name in skip or name in src_entries:
+            continue
+        path = os.path.join(dst_dir, name)
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+
+    for name, entry in src_entries.items():
+        dst = os.path.join(dst_dir, name)
+        if entry.is_dir(follow_symlinks=False):
+            if os.path.exists(dst) and not os.path.isdir(dst):
+                os.remove(dst)
+            copied += sync_tree(entry.path, dst, skip=())
+        elif not _same_file(entry.stat(follow_symlinks=False), dst):
+            if os.path.isdir(dst):
+                shutil.rmtree(dst)
+            shutil.copy2(entry.path, dst)
+            copied += 1
+
+    return copied
+
+
 def load_save(save_name):
-    """Load a save by copying its data to the active data directory"""
-    global REGION, REGION_DATA_DIR, CAREER_FILE, SEASON_FILE, SEASON
+    """Load a save by syncing its data into the active data directory"""
+    global REGION, REGION_DATA_DIR, CAREER_FILE, SEASON_FILE, SEASON_JOURNAL_FILE, SEASON
 
     save_path = get_save_path(save_name)
     if not os.path.exists(save_path):
@@ -159,15 +291,9 @@ def load_save(save_name):
     if current_save != save_name:
         save_current_to_file(current_save)
 
-    import shutil
-    if os.path.exists(DATA_DIR):
-        backup_dir = DATA_DIR + "_backup_temp"
-        if os.path.exists(backup_dir):
-            shutil.rmtree(backup_dir)
-        shutil.copytree(DATA_DIR, backup_dir)
-        shutil.rmtree(DATA_DIR)
-
-    shutil.copytree(save_path, DATA_DIR)
+    WRITER.flush()
+    CAREER_STORE.close()
+    sync_tree(save_path, DATA_DIR)
 
     set_current_save(save_name)
 
@@ -175,6 +301,7 @@ def load_save(save_name):
     REGION_DATA_DIR = os.path.join(DATA_DIR, REGION)
     CAREER_FILE = os.path.join(REGION_DATA_DIR, "career_stats.json")
     SEASON_FILE = os.path.join(REGION_DATA_DIR, "season_data.json")
+    SEASON_JOURNAL_FILE = os.path.join(REGION_DATA_DIR, "season_journal.jsonl")
 
     load_season()
 
@@ -182,25 +309,13 @@ def load_save(save_name):
 
 
 def save_current_to_file(save_name):
-    """Save current data directory to a save file"""
-    import shutil
+    """Save current data directory to a save file, copying only what changed"""
     save_path = get_save_path(save_name)
-
-    if not os.path.exists(save_path):
-        os.makedirs(save_path, exist_ok=True)
-
-    for item in os.listdir(DATA_DIR):
-        if item == "current_save.txt":
-            continue
-        src = os.path.join(DATA_DIR, item)
-        dst = os.path.join(save_path, item)
-
-        if os.path.isdir(src):
-            if os.path.exists(dst):
-                shutil.rmtree(dst)
-            shutil.copytree(src, dst)
-        else:
-            shutil.copy2(src, dst)
+    WRITER.flush()
+    CAREER_STORE.close()
+    sync_tree(DATA_DIR, save_path)
+    update_save_manifest(save_path)
+    CAREER_STORE.close()
 
 
 def delete_save(save_name):
@@ -248,12 +363,14 @@ def load_splash_texts():
 
 
 def set_region(region_name):
-    global REGION, REGION_DATA_DIR, CAREER_FILE, SEASON_FILE
+    global REGION, REGION_DATA_DIR, CAREER_FILE, SEASON_FILE, SEASON_JOURNAL_FILE
+    WRITER.flush()
     REGION = region_name.lower()
     REGION_DATA_DIR = os.path.join(DATA_DIR, REGION)
     os.makedirs(REGION_DATA_DIR, exist_ok=True)
     CAREER_FILE = os.path.join(REGION_DATA_DIR, "career_stats.json")
     SEASON_FILE = os.path.join(REGION_DATA_DIR, "season_data.json")
+    SEASON_JOURNAL_FILE = os.path.join(REGION_DATA_DIR, "season_journal.jsonl")
 
 
 random.seed(CONFIG["random_seed"])
@@ -706,6 +823,13 @@ TOURNAMENT_TYPES = {
     }
 }
 
+# Achievement codes follow this order, so new tournament types belong at the end of TOURNAMENT_TYPES
+register_achievement_types(TOURNAMENT_TYPES)
+
+TOURNAMENT_ARCHIVE = TournamentArchive(
+    TOURNAMENTS_ROOT, {t["label"].replace(" ", ""): key for key, t in TOURNAMENT_TYPES.items()}
+)
+
 TOURNAMENT_TEMPLATES = {
     "CASH_CUP": {
         "label": "CASH CUP",
@@ -821,7 +945,7 @@ class Player:
     career_lan_wins: int = 0
     career_victorycup_wins: int = 0
     best_finish: int = 999
-    career_achievements: list = field(default_factory=list)
+    career_achievements: AchievementLog = field(default_factory=AchievementLog)
 
     current_rank: int = 0
     points_to_first: int = 0
@@ -871,18 +995,7 @@ class POI:
     minis: List[str] = field(default_factory=list)
 
 
-def update_confidence(players: List[Player]):
-    ranked = sorted(
-        players,
-        key=lambda p: (
-            p.total_points,
-            p.wins,
-            p.total_elims,
-            -p.average_placement
-        ),
-        reverse=True
-    )
-
+def update_confidence(ranked: List[Player]):
     total = len(ranked)
 
     for idx, p in enumerate(ranked):
@@ -921,22 +1034,76 @@ def update_confidence(players: List[Player]):
 
 
 def load_season():
+    """Load the last season snapshot and replay the tournaments journaled since then"""
     global SEASON
+    WRITER.flush()
     if os.path.exists(SEASON_FILE):
         with open(SEASON_FILE, "r", encoding="utf-8") as f:
             SEASON = json.load(f)
     else:
         save_season()
+        return
+
+    if not os.path.exists(SEASON_JOURNAL_FILE):
+        return
+
+    with open(SEASON_JOURNAL_FILE, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                print("⚠️  Skipping damaged season journal entry")
+                continue
+            if record.get("seq", 0) > SEASON.get("journal_seq", 0):
+                apply_season_record(record)
 
 
 def save_season():
-    with open(SEASON_FILE, "w", encoding="utf-8") as f:
-        json.dump(SEASON, f, indent=2)
-    create_backup(SEASON_FILE, "season_data")
+    """Queue a full season snapshot; the journal is cleared once the snapshot is on disk"""
+    WRITER.submit(
+        _write_season_snapshot,
+        (SEASON_FILE, SEASON_JOURNAL_FILE, REGION_DATA_DIR, json.dumps(SEASON, indent=2)),
+        key=("season", SEASON_FILE)
+    )
+
+
+def _write_season_snapshot(job):
+    season_file, journal_file, region_data_dir, text = job
+    with open(season_file, "w", encoding="utf-8") as f:
+        f.write(text)
+    clear_season_journal(journal_file)
+    create_backup(season_file, "season_data", data=json.loads(text), region_data_dir=region_data_dir)
+
+
+def _append_season_journal(job):
+    journal_file, line = job
+    with open(journal_file, "a", encoding="utf-8") as f:
+        f.write(line)
+
+
+def clear_season_journal(journal_file=None):
+    journal_file = journal_file or SEASON_JOURNAL_FILE
+    if os.path.exists(journal_file):
+        os.remove(journal_file)
+
+
+def apply_season_record(record):
+    for name, (points, wins, elims, earnings) in record["players"].items():
+        s = SEASON["season_players"].setdefault(name, {"points": 0, "wins": 0, "elims": 0, "earnings": 0})
+        s["points"] += points
+        s["wins"] += wins
+        s["elims"] += elims
+        s["earnings"] += earnings
+
+    SEASON["tournaments_played"] += 1
+    SEASON["journal_seq"] = record["seq"]
 
 
 def load_social_data():
-    """Load friendships and rivalries from social_data.json"""
+    """Load friendships and rivalries from social_data.json (or the newer copy still waiting to be written)"""
+    pending = WRITER.pending(("social", SOCIAL_FILE))
+    if pending:
+        return json.loads(pending[-1][2])
     if os.path.exists(SOCIAL_FILE):
         with open(SOCIAL_FILE, "r", encoding="utf-8") as f:
             return json.load(f)
@@ -944,52 +1111,165 @@ def load_social_data():
 
 
 def save_social_data(social_data):
-    """Save friendships and rivalries to social_data.json"""
-    with open(SOCIAL_FILE, "w", encoding="utf-8") as f:
-        json.dump(social_data, f, indent=2)
-    create_backup(SOCIAL_FILE, "social_data")
+    """Queue friendships and rivalries to be saved to social_data.json"""
+    WRITER.submit(
+        _write_social_data,
+        (SOCIAL_FILE, REGION_DATA_DIR, json.dumps(social_data, indent=2)),
+        key=("social", SOCIAL_FILE)
+    )
 
 
-def create_backup(source_file, backup_prefix, max_backups=20):
-    """Create a timestamped backup and manage old backups"""
-    if not os.path.exists(source_file):
-        return
+def _write_social_data(job):
+    social_file, region_data_dir, text = job
+    with open(social_file, "w", encoding="utf-8") as f:
+        f.write(text)
+    create_backup(social_file, "social_data", data=json.loads(text), region_data_dir=region_data_dir)
 
-    backup_dir = os.path.join(REGION_DATA_DIR, "backups")
-    os.makedirs(backup_dir, exist_ok=True)
 
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    backup_filename = f"{backup_prefix}_backup_{timestamp}.json"
-    backup_path = os.path.join(backup_dir, backup_filename)
+class SocialGraph:
+    """Friendships and rivalries held in memory for the length of a tournament"""
 
-    try:
+    def __init__(self, social_data=None):
+        social_data = social_data or {}
+        self.friendships = social_data.get("friendships", {})
+        self.rivalries = social_data.get("rivalries", {})
+        self._strength_by_id = {}
+
+    @classmethod
+    def load(cls):
+        return cls(load_social_data())
+
+    def bind(self, players):
+        """Index stored friendship strengths by the player ids of this lobby"""
+        name_to_id = {p.name: p.id for p in players}
+        self._strength_by_id = {}
+        for p in players:
+            for friend_name, strength in self.friendships.get(p.name, {}).items():
+                friend_id = name_to_id.get(friend_name)
+                if friend_id is not None:
+                    self._strength_by_id[(p.id, friend_id)] = strength
+
+    def friendship_strength(self, player_id, other_id, default=1.0):
+        return self._strength_by_id.get((player_id, other_id), default)
+
+    def to_dict(self):
+        return {"friendships": self.friendships, "rivalries": self.rivalries}
+
+
+SOCIAL_GRAPH = SocialGraph()
+
+
+def get_backup_store(region_data_dir=None):
+    return BackupStore(os.path.join(region_data_dir or REGION_DATA_DIR, "backups"))
+
+
+def create_backup(source_file, backup_prefix, max_backups=20, data=None, region_data_dir=None, meta=None):
+    """Back up a save file (or the data it was just written from) unless it is unchanged"""
+    if data is None:
+        if not os.path.exists(source_file):
+            return
         with open(source_file, "r", encoding="utf-8") as src:
             data = json.load(src)
-        with open(backup_path, "w", encoding="utf-8") as dst:
-            json.dump(data, dst, indent=2)
-    except Exception as e:
+
+    try:
+        get_backup_store(region_data_dir).add(backup_prefix, data, max_backups, meta)
+    except OSError as e:
         print(f"⚠️  Backup failed: {e}")
-        return
 
+
+def migrate_career_file(region=None):
+    """Move a career_stats.json found in the region folder into the career store"""
+    region = (region or REGION).lower()
+    legacy_file = os.path.join(DATA_DIR, region, "career_stats.json")
+    if os.path.exists(legacy_file):
+        CAREER_STORE.import_json_file(region, legacy_file)
+
+
+CAREER_BACKUP_KINDS = ("career_stats", "career_rows")
+CAREER_DELTA_LIMIT = 50
+
+
+def queue_career_backup():
+    """Queue a full career backup of the region behind any career writes still waiting"""
+    WRITER.submit(_write_career_backup, (REGION, REGION_DATA_DIR), key=("career_backup", REGION))
+
+
+def _write_career_backup(job):
+    region, region_data_dir = job
+    store = CareerStore(CAREER_STORE.path)
     try:
-        all_backups = sorted([
-            f for f in os.listdir(backup_dir)
-            if f.startswith(backup_prefix) and f.endswith(".json")
-        ])
-
-        if len(all_backups) > max_backups:
-            for old_backup in all_backups[:-max_backups]:
-                os.remove(os.path.join(backup_dir, old_backup))
-    except Exception:
-        pass
+        create_backup(None, "career_stats", data=store.export_json(region), region_data_dir=region_data_dir)
+    finally:
+        store.close()
+
+
+def backup_career_data():
+    queue_career_backup()
+    WRITER.flush()
+
 
+def backup_career_rows(store, region, rows, region_data_dir):
+    """Back up only the rows a lobby just wrote, stacked on the latest full career backup.
 
-def load_career_data(players: List[Player]):
-    if not os.path.exists(CAREER_FILE):
+    A full backup is taken instead when there is none yet or CAREER_DELTA_LIMIT lobbies are
+    already stacked on it; otherwise full backups only happen on save, season end and restore."""
+    history = get_backup_store(region_data_dir).history(CAREER_BACKUP_KINDS)
+    depth = next((i for i, s in enumerate(history) if s["kind"] == "career_stats"), None)
+    if depth is None or depth >= CAREER_DELTA_LIMIT:
+        create_backup(None, "career_stats", data=store.export_json(region), region_data_dir=region_data_dir)
         return
+    create_backup(None, "career_rows", max_backups=CAREER_DELTA_LIMIT * 2, data=rows,
+                  region_data_dir=region_data_dir, meta={"base": history[depth]["hash"], "depth": depth + 1})
+
+
+def _career_chain(history, index):
+    """The full backup and the lobby backups (oldest first) that rebuild history[index], or None if pruned"""
+    point = history[index]
+    if point["kind"] == "career_stats":
+        return point, []
+    deltas = []
+    for s in history[index:]:
+        if s["kind"] == "career_stats":
+            if s["hash"] == point["base"] and len(deltas) == point["depth"]:
+                return s, deltas[::-1]
+            return None
+        deltas.append(s)
+    return None
+
+
+def career_restore_points(store=None):
+    """Every career backup that can still be rebuilt, most recent first"""
+    history = (store or get_backup_store()).history(CAREER_BACKUP_KINDS)
+    return [s for i, s in enumerate(history) if _career_chain(history, i)]
+
+
+def restore_career_backup(snapshot):
+    WRITER.flush()
+    store = get_backup_store()
+    history = store.history(CAREER_BACKUP_KINDS)
+    base, deltas = _career_chain(history, history.index(snapshot))
+    data = store.load(base)
+    for delta in deltas:
+        data.update(store.load(delta))
+    CAREER_STORE.import_json(REGION, data)
+    # Later lobby backups stack on the restored careers, so they need a full backup of their own
+    backup_career_data()
+
+
+def restore_season_backup(snapshot):
+    WRITER.flush()
+    with open(SEASON_FILE, "w", encoding="utf-8") as f:
+        json.dump(get_backup_store().load(snapshot), f, indent=2)
+    clear_season_journal()
+
 
-    with open(CAREER_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
+def load_career_data(players: List[Player], data=None):
+    if data is None:
+        migrate_career_file()
+        names = [p.name for p in players]
+        data = CAREER_STORE.load(REGION, names)
+        for _, _, rows in WRITER.pending(("career", REGION)):
+            data.update((name, rows[name]) for name in names if name in rows)
 
     for p in players:
         if p.name in data:
@@ -1005,17 +1285,12 @@ def load_career_data(players: List[Player]):
             p.career_lan_wins = stats.get("lan_wins", 0)
             p.career_victorycup_wins = stats.get("victorycup_wins", 0)
             p.best_finish = stats.get("best_finish", 999)
-            p.career_achievements = stats.get("achievements", [])
+            p.career_achievements = AchievementLog.from_data(stats.get("achievements", []))
 
 
 def update_social_data(players: List[Player]):
     """Update friendships and rivalries based on tournament outcomes"""
-    social_data = load_social_data()
-
-    if "friendships" not in social_data:
-        social_data["friendships"] = {}
-    if "rivalries" not in social_data:
-        social_data["rivalries"] = {}
+    social_data = SOCIAL_GRAPH.to_dict()
 
     id_to_player = {p.id: p for p in players}
 
@@ -1087,16 +1362,11 @@ def update_social_data(players: List[Player]):
 
 
 def save_career_data(players: List[Player]):
-    existing_data = {}
-    if os.path.exists(CAREER_FILE):
-        try:
-            with open(CAREER_FILE, "r", encoding="utf-8") as f:
-                existing_data = json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            existing_data = {}
+    migrate_career_file()
 
+    rows = {}
     for p in players:
-        existing_data[p.name] = {
+        rows[p.name] = {
             "earnings": p.career_earnings,
             "kills": p.career_kills,
             "tournaments": p.career_tournaments,
@@ -1108,13 +1378,25 @@ def save_career_data(players: List[Player]):
             "lan_wins": p.career_lan_wins,
             "victorycup_wins": p.career_victorycup_wins,
             "best_finish": p.best_finish,
-            "achievements": getattr(p, "career_achievements", [])
+            "achievements": p.career_achievements.to_columns()
         }
 
-    with open(CAREER_FILE, "w", encoding="utf-8") as f:
-        json.dump(existing_data, f, indent=2)
+    WRITER.submit(
+        _write_career_rows,
+        (REGION, REGION_DATA_DIR, rows),
+        key=("career", REGION),
+        merge=lambda old, new: (new[0], new[1], {**old[2], **new[2]})
+    )
+
 
-    create_backup(CAREER_FILE, "career_stats")
+def _write_career_rows(job):
+    region, region_data_dir, rows = job
+    store = CareerStore(CAREER_STORE.path)
+    try:
+        store.upsert(region, rows)
+        backup_career_rows(store, region, rows, region_data_dir)
+    finally:
+        store.close()
 
 
 def init_season_players(players):
@@ -1338,19 +1620,32 @@ def print_tournament_win_ticker(players, current_match, total_matches):
     if not projections:
         return
 
-    scale = max(1, sum(p.total_points for _, ppts, _, p in projections) / len(projections) / 2)
+    simulated = None
+    if CONFIG.get("simulated_win_odds", False):
+        simulated = simulate_win_chances(players, current_match)
 
-    exp_scores = [math.exp(proj / scale) for proj, _, _, _ in projections]
-    total_exp = sum(exp_scores)
+    if simulated:
+        win_counts, runs = simulated
+        rows = [(win_counts.get(p.name, 0) / runs * 100, p) for _, _, _, p in projections]
+    else:
+        scale = max(1, sum(p.total_points for _, ppts, _, p in projections) / len(projections) / 2)
+
+        exp_scores = [math.exp(proj / scale) for proj, _, _, _ in projections]
+        total_exp = sum(exp_scores)
+        rows = [((math.exp(proj / scale) / total_exp) * 100, p) for proj, _, _, p in projections]
 
     print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━")
     print(f"WIN % TICKER – GAME {current_match}/{total_matches} (Remaining: {remaining})")
+    if simulated:
+        print(f"Based on {simulated[1]} simulated finishes")
+    elif CONFIG.get("simulated_win_odds", False):
+        print("Not enough simulated finishes in time, showing projected odds")
     print("━━━━━━━━━━━━━━━━━━━━━━━━━━")
 
-    projections.sort(key=lambda x: x[0], reverse=True)
+    rows.sort(key=lambda x: (x[0], x[1].total_points), reverse=True)
 
-    for i, (proj_pts, curr_pts, wins, p) in enumerate(projections[:6]):
-        chance = (math.exp(proj_pts / scale) / total_exp) * 100
+    for i, (chance, p) in enumerate(rows[:6]):
+        curr_pts = p.total_points
         chance = max(0.5, min(99.5, chance))
 
         bar_len = int(chance / 12.5)
@@ -1544,8 +1839,9 @@ def get_victory_commentary(winner, match_number: int, total_matches: int):
     return random.choice(commentary)
 
 
-def update_tournament_context(players: List[Player]):
-    leaderboard = sorted(
+def rank_players(players: List[Player]):
+    """The lobby in leaderboard order, without touching anyone's stored standing"""
+    return sorted(
         players,
         key=lambda p: (
             p.total_points,
@@ -1556,6 +1852,11 @@ def update_tournament_context(players: List[Player]):
         reverse=True
     )
 
+
+def update_tournament_context(players: List[Player]):
+    """Rank the lobby once per match, store each player's standing on them and return the ranked list"""
+    leaderboard = rank_players(players)
+
     for idx, p in enumerate(leaderboard):
         p.current_rank = idx + 1
 
@@ -1576,6 +1877,8 @@ def update_tournament_context(players: List[Player]):
 
         p.safety_margin = p.points_to_below
 
+    return leaderboard
+
 
 def update_player_strategy(player: Player, match_number: int):
     pressure = match_number / CONFIG["matches"]
@@ -1686,73 +1989,201 @@ def update_player_strategy(player: Player, match_number: int):
     player.risk_tolerance = max(0.2, min(1.0, risk))
 
 
-def choose_attacker(players):
-    weights = []
-    for p in players:
-        w = p.skill * (0.7 + p.risk_tolerance)
-        weights.append(max(w, 1))
-    return random.choices(players, weights=weights, k=1)[0]
+def get_attacker_weight(player):
+    return max(player.skill * (0.7 + player.risk_tolerance), 1)
 
 
-def choose_target(attacker, players, match_number=1, config=None):
-    targets = [p for p in players if p != attacker]
+def get_base_target_weight(target):
+    """Part of a target's weight that does not depend on who is attacking"""
+    w = target.skill
+    if target.current_rank > 50:
+        w *= 0.7
+    return w
 
-    max_rivalry = 0
-    most_hated = None
-    for t in targets:
-        hatred = attacker.rivals.get(t.id, 0)
-        if hatred > max_rivalry:
-            max_rivalry = hatred
-            most_hated = t
 
-    if max_rivalry >= 5:
-        toxic_threshold = 0.15 + (max_rivalry - 5) * 0.08
-        if random.random() < min(0.65, toxic_threshold):
-            return most_hated
+def get_target_weight(attacker, t, is_crunch_time):
+    w = t.skill
 
-    weights = []
-    is_crunch_time = match_number >= (config.get("matches", 12) - 2) if config else False
-    social_data = load_social_data()
+    is_friend = t.id in attacker.friends
+    friendship_strength = 1.0
 
-    for t in targets:
-        w = t.skill
+    if is_friend:
+        friendship_strength = SOCIAL_GRAPH.friendship_strength(attacker.id, t.id)
 
-        is_friend = t.id in attacker.friends
-        friendship_strength = 1.0
+    if is_friend and not is_crunch_time:
+        if friendship_strength >= 1.5:
+            w *= 0.25
+        elif friendship_strength >= 1.0:
+            w *= 0.4
+        else:
+            w *= 0.6
+    elif is_friend and is_crunch_time and attacker.grief_bias < 0.8:
+        if friendship_strength >= 1.5:
+            w *= 0.5
+        else:
+            w *= 0.7
 
-        if is_friend:
-            friendship_strength = social_data.get("friendships", {}).get(attacker.name, {}).get(t.name, 1.0)
+    if attacker.grief_bias > 0.8 and t.current_rank == 1:
+        w *= (1 + attacker.grief_bias * 3.0)
+    elif attacker.grief_bias > 0 and t.current_rank < attacker.current_rank:
+        w *= (1 + attacker.grief_bias)
 
-        if is_friend and not is_crunch_time:
-            if friendship_strength >= 1.5:
-                w *= 0.25
-            elif friendship_strength >= 1.0:
-                w *= 0.4
-            else:
-                w *= 0.6
-        elif is_friend and is_crunch_time and attacker.grief_bias < 0.8:
-            if friendship_strength >= 1.5:
-                w *= 0.5
-            else:
-                w *= 0.7
+    hatred = attacker.rivals.get(t.id, 0)
+    w *= (1 + hatred * 0.25)
 
-        if attacker.grief_bias > 0.8 and t.current_rank == 1:
-            w *= (1 + attacker.grief_bias * 3.0)
-        elif attacker.grief_bias > 0 and t.current_rank < attacker.current_rank:
-            w *= (1 + attacker.grief_bias)
+    fear = attacker.fear.get(t.id, 0)
+    w *= max(0.4, 1 - fear * 0.15)
 
-        hatred = attacker.rivals.get(t.id, 0)
-        w *= (1 + hatred * 0.25)
+    if t.current_rank > 50:
+        w *= 0.7
 
-        fear = attacker.fear.get(t.id, 0)
-        w *= max(0.4, 1 - fear * 0.15)
+    return max(w, 1)
 
-        if t.current_rank > 50:
-            w *= 0.7
 
-        weights.append(max(w, 1))
+class LootClock:
+    """Loot and time since last fight, advanced lazily from a match-wide fight counter.
+
+    Every resolved fight ticks the clock once for everyone who sat it out. Instead of walking the
+    whole lobby each time, a player's loot is caught up in one step when it is about to be read.
+    """
+
+    def __init__(self, players: List[Player]):
+        self.ticks = 0
+        self._synced = {p.id: 0 for p in players}
+
+    def tick(self, attacker, defender):
+        self.ticks += 1
+        self._synced[attacker.id] = self.ticks
+        self._synced[defender.id] = self.ticks
+
+    def materialize(self, player):
+        elapsed = self.ticks - self._synced.get(player.id, self.ticks)
+        if elapsed <= 0:
+            return
+        self._synced[player.id] = self.ticks
+
+        start = player.time_since_fight
+        end = start + elapsed
+        slow_until = min(end, 3) if player.contested_drop else start
+        fast_until = min(end, 5)
+
+        slow_steps = max(0, slow_until - start)
+        fast_steps = max(0, fast_until - max(start, slow_until))
+        late_steps = elapsed - slow_steps - fast_steps
+
+        loot_gain = slow_steps * 0.03 + fast_steps * 0.08 + late_steps * 0.05
+        player.time_since_fight = end
+        player.loot = min(1.0, player.loot + loot_gain)
+
+    def finish(self, players):
+        for p in players:
+            self.materialize(p)
+
+
+class MatchLobby:
+    """Players still alive in a match, kept in Fenwick trees for O(log n) draws and eliminations"""
+
+    def __init__(self, alive: List[Player]):
+        self.alive = list(alive)
+        self._position = {p.id: i for i, p in enumerate(self.alive)}
+
+        self._attack_order = list(self.alive)
+        self._attack_slot = {p.id: i for i, p in enumerate(self._attack_order)}
+        self._attackers = WeightedSampler([get_attacker_weight(p) for p in self._attack_order])
+
+        # Targets are stored in leaderboard order so "everyone ranked above the attacker" is a prefix
+        self._by_rank = sorted(self.alive, key=lambda p: p.current_rank)
+        self._rank_slot = {p.id: i for i, p in enumerate(self._by_rank)}
+        self._targets = WeightedSampler([get_base_target_weight(p) for p in self._by_rank])
+        self._light = {p.id for p in self.alive if get_base_target_weight(p) < 1}
+
+    def __len__(self):
+        return len(self.alive)
+
+    def get(self, player_id):
+        index = self._position.get(player_id)
+        return None if index is None else self.alive[index]
+
+    def remove(self, player):
+        index = self._position.pop(player.id, None)
+        if index is None:
+            return
+        last = self.alive.pop()
+        if last is not player:
+            self.alive[index] = last
+            self._position[last.id] = index
+
+        self._attackers.remove(self._attack_slot[player.id])
+        self._targets.remove(self._rank_slot[player.id])
+        self._light.discard(player.id)
+
+    def draw_attacker(self):
+        return self._attack_order[self._attackers.sample()]
+
+    def draw_target(self, attacker, is_crunch_time):
+        targets = self._targets
+        grief = attacker.grief_bias
+        boost = 1 + grief if grief > 0 else 1.0
+        cutoff = self._rank_slot[attacker.id]
+
+        # Only the attacker's friends, rivals and fears (plus the rank 1 player for griefers) deviate
+        # from the shared base weights, so patch those slots for this draw and put them back after.
+        special = {attacker.id, self._by_rank[0].id}
+        special.update(attacker.friends)
+        special.update(attacker.rivals)
+        special.update(attacker.fear)
+        special.update(self._light)
+
+        saved = []
+        for player_id in special:
+            if player_id not in self._position:
+                continue
+            slot = self._rank_slot[player_id]
+            target = self._by_rank[slot]
+            exact = 0.0 if target is attacker else get_target_weight(attacker, target, is_crunch_time)
+            saved.append((slot, targets.weights[slot]))
+            targets.update(slot, exact / boost if slot < cutoff else exact)
+
+        above = targets.prefix_sum(cutoff)
+        boosted_above = above * boost
+        roll = random.random() * (boosted_above + targets.total - above)
+        if roll < boosted_above:
+            slot = targets.find(roll / boost)
+        else:
+            slot = targets.find(above + roll - boosted_above)
+
+        for saved_slot, weight in saved:
+            targets.update(saved_slot, weight)
+
+        return self._by_rank[slot]
+
+
+def batch_mod_hooks():
+    """Lobby-wide mod hooks are their own setting and need NumPy"""
+    return CONFIG.get("batch_mod_hooks", False) and np is not None
+
+
+def choose_attacker(lobby: MatchLobby):
+    return lobby.draw_attacker()
+
+
+def choose_target(attacker, lobby: MatchLobby, match_number=1, config=None):
+    max_rivalry = 0
+    most_hated = None
+    for rival_id, hatred in attacker.rivals.items():
+        if hatred > max_rivalry and rival_id != attacker.id:
+            rival = lobby.get(rival_id)
+            if rival:
+                max_rivalry = hatred
+                most_hated = rival
+
+    if max_rivalry >= 5:
+        toxic_threshold = 0.15 + (max_rivalry - 5) * 0.08
+        if random.random() < min(0.65, toxic_threshold):
+            return most_hated
 
-    return random.choices(targets, weights=weights, k=1)[0]
+    is_crunch_time = match_number >= (config.get("matches", 12) - 2) if config else False
+    return lobby.draw_target(attacker, is_crunch_time)
 
 
 def register_elim(killer: Player, victim: Player, match_number: int = 1):
@@ -1762,19 +2193,15 @@ def register_elim(killer: Player, victim: Player, match_number: int = 1):
     friendship_strength = 1.0
 
     if are_friends:
-        social_data = load_social_data()
-        friendship_strength = social_data.get("friendships", {}).get(killer.name, {}).get(victim.name, 1.0)
+        friendship_strength = SOCIAL_GRAPH.friendship_strength(killer.id, victim.id)
 
     did_emote = random.random() < 0.12
     if did_emote:
         base_rivalry += random.uniform(2.0, 3.5)
         if random.random() < 0.1:
-            emote_messages = [
-                f"{Colors.ITALIC}💀 {display_name(killer)} hits the emote on {display_name(victim)}!{Colors.RESET}",
-                f"{Colors.ITALIC}🕺 {display_name(killer)} is dancing... {display_name(victim)} won't forget that.{Colors.RESET}",
-                f"{Colors.ITALIC}😤 {display_name(killer)} with the disrespectful emote on {display_name(victim)}!{Colors.RESET}",
-            ]
-            print(random.choice(emote_messages))
+            style = random.randrange(len(EMOTE_LINES))
+            if EVENT_BUS.active:
+                EVENT_BUS.emit(EmoteEvent(match_number, killer, victim, style))
 
     skill_gap = victim.skill - killer.skill
     if skill_gap >= 15:
@@ -1851,14 +2278,16 @@ def maybe_switch_archetype(player: Player, match_number: int):
 
 
 def simulate_match(players: List[Player], match_number: int):
-    update_tournament_context(players)
+    leaderboard = update_tournament_context(players)
 
     for p in players:
         update_player_strategy(p, match_number)
 
-    for mod in ACTIVE_MODS:
-        if mod.enabled:
-            mod.on_match_start(players, match_number, CONFIG)
+    for hook in MOD_HOOKS.on_match_start:
+        hook(players, match_number, CONFIG)
+
+    if EVENT_BUS.active:
+        EVENT_BUS.emit(MatchStartEvent(match_number, players))
 
     weather_reports = [
         "☀️ Clear skies. Perfect conditions for high-kill games.",
@@ -1869,50 +2298,52 @@ def simulate_match(players: List[Player], match_number: int):
         "☄️ Strange atmospheric activity. Something is coming..."
     ]
     current_weather = random.choice(weather_reports)
+    quiet = is_headless()
 
-    print("\n" + "━" * 50)
-    print(f"🪂 GAME {match_number} / {CONFIG['matches']} — BATTLE BUS LAUNCHING")
-    print("━" * 50)
-    sim_sleep(1)
-    print(current_weather)
-    sim_sleep(1.5)
+    if not quiet:
+        print("\n" + "━" * 50)
+        print(f"🪂 GAME {match_number} / {CONFIG['matches']} — BATTLE BUS LAUNCHING")
+        print("━" * 50)
+        sim_sleep(1)
+        print(current_weather)
+        sim_sleep(1.5)
 
-    print(f"🏝️ {len(players)} players drop into the island")
-    sim_sleep(1)
+        print(f"🏝️ {len(players)} players drop into the island")
+        sim_sleep(1)
 
-    print(f"Storm Circles: {CONFIG['storm_circles']}")
-    sim_sleep(0.8)
-    print(f"Elim Points: {CONFIG['elim_points']}\n")
-    sim_sleep(1)
+        print(f"Storm Circles: {CONFIG['storm_circles']}")
+        sim_sleep(0.8)
+        print(f"Elim Points: {CONFIG['elim_points']}\n")
+        sim_sleep(1)
 
-    top_players = sorted(players, key=lambda p: p.total_points, reverse=True)[:3]
-    print("⭐ Players to Watch")
-    for p in top_players:
-        print(f"• {display_name(p)}")
-        sim_sleep(0.3)
+        print("⭐ Players to Watch")
+        for p in leaderboard[:3]:
+            print(f"• {display_name(p)}")
+            sim_sleep(0.3)
 
-    print("\n🚐 Bus launches in 3…")
-    sim_sleep(1)
-    print("2…")
-    sim_sleep(1)
-    print("1…")
-    sim_sleep(1)
-    print("━" * 50)
-    sim_sleep(0.5)
+        print("\n🚐 Bus launches in 3…")
+        sim_sleep(1)
+        print("2…")
+        sim_sleep(1)
+        print("1…")
+        sim_sleep(1)
+        print("━" * 50)
+        sim_sleep(0.5)
 
     pois = generate_pois()
     assign_drops(players, pois)
 
-    print("\nPlayer drop assignments (sample 10):")
-    for p in players[:10]:
-        print(f"{p.name} -> {p.drop_poi}")
-        sim_sleep(0.3)
-    if len(players) > 10:
-        print(f"...and {len(players) - 10} more players")
-        sim_sleep(0.5)
+    if not quiet:
+        print("\nPlayer drop assignments (sample 10):")
+        for p in players[:10]:
+            print(f"{p.name} -> {p.drop_poi}")
+            sim_sleep(0.3)
+        if len(players) > 10:
+            print(f"...and {len(players) - 10} more players")
+            sim_sleep(0.5)
 
-    print("\n🪂 Players are now landing on the island…")
-    sim_sleep(2)
+        print("\n🪂 Players are now landing on the island…")
+        sim_sleep(2)
 
     for p in players:
         p.loot = 0.0
@@ -1931,19 +2362,30 @@ def simulate_match(players: List[Player], match_number: int):
                 p.contested_drop = True
 
     pre_dead_count = 0
-    for player in players:
-        for mod in ACTIVE_MODS:
-            if mod.enabled:
-                result = mod.on_player_spawn(player, match_number, CONFIG)
-                if result in ("NO_LOAD", "CRASH"):
-                    pre_dead_count += 1
-                    reason = "didn't load in" if result == "NO_LOAD" else "crashed"
-                    print(
-                        f"{'❌' if result == 'NO_LOAD' else '💥'} {Colors.SOFT_RED}{display_name(player)} {reason}! {Colors.RESET}")
-                    player.alive = False
+
+    def spawn_failed(player, result):
+        nonlocal pre_dead_count
+        pre_dead_count += 1
+        if EVENT_BUS.active:
+            event_type = NoLoadEvent if result == "NO_LOAD" else CrashEvent
+            EVENT_BUS.emit(event_type(match_number, player))
+        player.alive = False
+
+    for hook in MOD_HOOKS.on_player_spawn_batch:
+        failed = hook(players, match_number, CONFIG)
+        for player in players if failed else ():
+            if player.id in failed:
+                spawn_failed(player, failed[player.id])
+
+    spawn_hooks = MOD_HOOKS.on_player_spawn
+    for player in players if spawn_hooks else ():
+        for hook in spawn_hooks:
+            result = hook(player, match_number, CONFIG)
+            if result in ("NO_LOAD", "CRASH"):
+                spawn_failed(player, result)
 
     if pre_dead_count > 0:
-        print(f"\n⚠️  {pre_dead_count} player(s) eliminated before fights began\n")
+        sim_print(f"\n⚠️  {pre_dead_count} player(s) eliminated before fights began\n")
         sim_sleep(1.2)
 
     alive = [p for p in players if p.alive]
@@ -1957,13 +2399,13 @@ def simulate_match(players: List[Player], match_number: int):
 
     if is_reload:
         reboots = {p.id: 0 for p in players}
-        print(f"\n{Colors.SOFT_CYAN + Colors.BOLD}🔄 RELOAD MODE: Each elim earns 1 reboot!{Colors.RESET}")
-        print(f"{Colors.LIGHT_GRAY}   Reboots disable at {reboot_cutoff} players remaining{Colors.RESET}")
+        sim_print(f"\n{Colors.SOFT_CYAN + Colors.BOLD}🔄 RELOAD MODE: Each elim earns 1 reboot!{Colors.RESET}")
+        sim_print(f"{Colors.LIGHT_GRAY}   Reboots disable at {reboot_cutoff} players remaining{Colors.RESET}")
         sim_sleep(1)
 
     rage_quitters = [p for p in players if getattr(p, '_has_rage_quit', False)]
     if rage_quitters:
-        print(
+        sim_print(
             f"\n{Colors.SOFT_RED + Colors.BOLD}😤 {len(rage_quitters)} player(s) have rage quit and won't play this match!{Colors.RESET}")
         rage_quitters.sort(key=lambda p: p.skill)
         next_placement = len(players)
@@ -1978,21 +2420,23 @@ def simulate_match(players: List[Player], match_number: int):
     current_placement = len(alive)
 
     if len(alive) <= 1:
-        print("Match aborted — no one left alive after spawn events.")
-        return
+        sim_print("Match aborted — no one left alive after spawn events.")
+        return None
 
     random.shuffle(alive)
+    lobby = MatchLobby(alive)
+    loot_clock = LootClock(alive)
 
     late_game = match_number >= CONFIG["matches"] - 2
 
-    def should_fight(attacker, defender):
+    def should_fight(attacker, defender, attacker_skill, defender_skill):
         if attacker.contested_drop and attacker.time_since_fight <= 2:
             if defender.drop_poi == attacker.drop_poi:
                 return True
 
-        if defender.skill > attacker.skill + 15:
+        if defender_skill > attacker_skill + 15:
             return False
-        if attacker.skill > defender.skill + 10:
+        if attacker_skill > defender_skill + 10:
             return True
         if late_game and attacker.points_to_first < 50:
             return random.random() < 0.8
@@ -2005,8 +2449,8 @@ def simulate_match(players: List[Player], match_number: int):
             return random.random() < 0.3
         return random.random() < attacker.risk_tolerance
 
-    def get_attack_weight(player, target):
-        base = player.skill
+    def get_attack_weight(player, target, skill):
+        base = skill
         if player.current_archetype == "Fragger":
             base *= 1.2
         elif player.current_archetype == "Aggressive":
@@ -2015,7 +2459,7 @@ def simulate_match(players: List[Player], match_number: int):
             base *= 0.8
 
         confidence_boost = 0.15
-        if player.skill >= 100:
+        if skill >= 100:
             confidence_boost = 0.20
         base *= (1.0 + player.confidence * confidence_boost)
 
@@ -2024,19 +2468,19 @@ def simulate_match(players: List[Player], match_number: int):
 
         fear_level = player.fear.get(target.id, 0)
         base *= max(0.65, 1 - fear_level * 0.08)
-        if late_game and player.skill >= 85:
+        if late_game and skill >= 85:
             base *= 1.1
         return max(base, 1)
 
-    def get_defense_weight(player, attacker):
-        base = player.skill
+    def get_defense_weight(player, attacker, skill):
+        base = skill
         if player.current_archetype == "Passive":
             base *= 1.1
         elif player.current_archetype == "Aggressive":
             base *= 0.9
 
         confidence_boost = 0.1
-        if player.skill >= 100:
+        if skill >= 100:
             confidence_boost = 0.15
         base *= (1.0 + player.confidence * confidence_boost)
 
@@ -2047,73 +2491,73 @@ def simulate_match(players: List[Player], match_number: int):
         base *= max(0.65, 1 - fear_level * 0.08)
         return max(base, 1)
 
-    while len(alive) > 1:
-        if is_reload and reboots_enabled and len(alive) <= reboot_cutoff:
+    fight_hooks = MOD_HOOKS.on_fight
+    elim_hooks = MOD_HOOKS.on_player_eliminated
+
+    while len(lobby) > 1:
+        if is_reload and reboots_enabled and len(lobby) <= reboot_cutoff:
             reboots_enabled = False
-            print(
-                f"\n{Colors.SOFT_RED + Colors.BOLD}⚠️  REBOOTS DISABLED! {len(alive)} players remaining - all deaths are now permanent!{Colors.RESET}\n")
+            sim_print(
+                f"\n{Colors.SOFT_RED + Colors.BOLD}⚠️  REBOOTS DISABLED! {len(lobby)} players remaining - all deaths are now permanent!{Colors.RESET}\n")
             sim_sleep(1.5)
 
-        attacker = choose_attacker(alive)
-        defender = choose_target(attacker, alive, match_number, CONFIG)
+        attacker = choose_attacker(lobby)
+        defender = choose_target(attacker, lobby, match_number, CONFIG)
 
         hatred = attacker.rivals.get(defender.id, 0)
         is_toxic_grief = hatred >= 5 and random.random() < 0.3
 
         if not attacker.alive or not defender.alive:
-            alive = [p for p in alive if p.alive]
+            for p in (attacker, defender):
+                if not p.alive:
+                    loot_clock.materialize(p)
+                    lobby.remove(p)
             continue
 
         allow_fight = True
-        for mod in ACTIVE_MODS:
-            if mod.enabled:
-                if not mod.on_fight(attacker, defender, CONFIG):
-                    allow_fight = False
-                    break
+        modifiers = None
+        for hook in fight_hooks:
+            result = hook(attacker, defender, CONFIG)
+            if not result:
+                allow_fight = False
+                break
+            if isinstance(result, FightModifiers):
+                modifiers = result if modifiers is None else modifiers.combine(result)
+        loot_clock.materialize(attacker)
+        loot_clock.materialize(defender)
 
         if not allow_fight:
             continue
 
-        if not should_fight(attacker, defender):
+        if modifiers is None:
+            attacker_skill, defender_skill = attacker.skill, defender.skill
+        else:
+            attacker_skill, defender_skill = modifiers.skill(attacker), modifiers.skill(defender)
+
+        if not should_fight(attacker, defender, attacker_skill, defender_skill):
             if not is_toxic_grief:
                 continue
             else:
                 if random.random() < 0.05:
-                    print(
+                    sim_print(
                         f"{Colors.SOFT_RED}{Colors.ITALIC}🔥 {display_name(attacker)} is hunting down {display_name(defender)} — this rivalry has gotten personal!{Colors.RESET}")
                     sim_sleep(0.5)
 
         p1, p2 = attacker, defender
 
-        atk1 = get_attack_weight(p1, p2)
-        def2 = get_defense_weight(p2, p1)
+        atk1 = get_attack_weight(p1, p2, attacker_skill)
+        def2 = get_defense_weight(p2, p1, defender_skill)
 
         p1_win_chance = atk1 / (atk1 + def2)
-        skill_gap = abs(p1.skill - p2.skill)
+        skill_gap = abs(attacker_skill - defender_skill)
 
-        if p1.skill >= 100 or p2.skill >= 100:
+        if attacker_skill >= 100 or defender_skill >= 100:
             variance_modifier = max(0.35, 1 - skill_gap / 80)
         else:
             variance_modifier = max(0.25, 1 - skill_gap / 100)
 
         roll = random.random() * variance_modifier
 
-        current_leaderboard = sorted(players, key=lambda p: p.total_points, reverse=True)[:5]
-        top5_names = {p.name for p in current_leaderboard}
-
-        if CONFIG.get("killfeed_highlights", True):
-            current_leaderboard = sorted(players, key=lambda p: p.total_points, reverse=True)[:5]
-            top5_names = {p.name for p in current_leaderboard}
-
-            def colored_name(p):
-                base = display_name(p)
-                if p.name in top5_names:
-                    return f"{Colors.SOFT_GOLD}{base}{Colors.RESET}"
-                return base
-        else:
-            def colored_name(p):
-                return display_name(p)
-
         if roll < p1_win_chance:
             elims[p1.id] += 1
             register_elim(p1, p2, match_number)
@@ -2139,24 +2583,22 @@ def simulate_match(players: List[Player], match_number: int):
 
             if is_reload and reboots_enabled and reboots.get(p2.id, 0) > 0:
                 reboots[p2.id] -= 1
-                emoji = "🔄"
-                print(
-                    f"{colored_name(p1)} {emoji} {colored_name(p2)} {Colors.SOFT_GREEN}(REBOOTED! {reboots[p2.id]} left){Colors.RESET}")
+                if EVENT_BUS.active:
+                    EVENT_BUS.emit(RebootEvent(match_number, p1, p2, reboots[p2.id]))
                 p2.confidence = max(0.5, p2.confidence * 0.92)
                 p2.loot = max(0.0, p2.loot - 0.25)
                 p2.time_since_fight = 0
             else:
                 p2.alive = False
-                alive.remove(p2)
+                lobby.remove(p2)
                 placements[p2.id] = current_placement
                 current_placement -= 1
-                emoji = "🌩️" if random.random() < 0.05 else "⚔️"
-                reboot_msg = f" {Colors.SOFT_RED}(OUT OF REBOOTS){Colors.RESET}" if is_reload and not reboots_enabled else ""
-                print(
-                    f"{colored_name(p1)} {emoji} {colored_name(p2)} {Colors.LIGHT_GRAY}(Placement: {placements[p2.id]}){reboot_msg}{Colors.RESET}")
-                for mod in ACTIVE_MODS:
-                    if mod.enabled:
-                        mod.on_player_eliminated(p2, p1, CONFIG)
+                lightning = random.random() < 0.05
+                if EVENT_BUS.active:
+                    EVENT_BUS.emit(KillEvent(match_number, p1, p2, placements[p2.id], lightning,
+                                             is_reload and not reboots_enabled))
+                for hook in elim_hooks:
+                    hook(p2, p1, CONFIG)
         else:
             elims[p2.id] += 1
             register_elim(p2, p1, match_number)
@@ -2182,39 +2624,29 @@ def simulate_match(players: List[Player], match_number: int):
 
             if is_reload and reboots_enabled and reboots.get(p1.id, 0) > 0:
                 reboots[p1.id] -= 1
-                emoji = "🔄"
-                print(
-                    f"{colored_name(p2)} {emoji} {colored_name(p1)} {Colors.SOFT_GREEN}(REBOOTED! {reboots[p1.id]} left){Colors.RESET}")
+                if EVENT_BUS.active:
+                    EVENT_BUS.emit(RebootEvent(match_number, p2, p1, reboots[p1.id]))
                 p1.confidence = max(0.5, p1.confidence * 0.92)
                 p1.loot = max(0.0, p1.loot - 0.25)
                 p1.time_since_fight = 0
             else:
                 p1.alive = False
-                alive.remove(p1)
+                lobby.remove(p1)
                 placements[p1.id] = current_placement
                 current_placement -= 1
-                emoji = "🌩️" if random.random() < 0.05 else "⚔️"
-                reboot_msg = f" {Colors.SOFT_RED}(OUT OF REBOOTS){Colors.RESET}" if is_reload and not reboots_enabled else ""
-                print(
-                    f"{colored_name(p2)} {emoji} {colored_name(p1)} {Colors.LIGHT_GRAY}(Placement: {placements[p1.id]}){reboot_msg}{Colors.RESET}")
-                for mod in ACTIVE_MODS:
-                    if mod.enabled:
-                        mod.on_player_eliminated(p1, p2, CONFIG)
-
-        for p in alive:
-            if p != attacker and p != defender:
-                p.time_since_fight += 1
-                if p.contested_drop and p.time_since_fight <= 3:
-                    loot_gain = 0.03
-                elif p.time_since_fight <= 5:
-                    loot_gain = 0.08
-                else:
-                    loot_gain = 0.05
+                lightning = random.random() < 0.05
+                if EVENT_BUS.active:
+                    EVENT_BUS.emit(KillEvent(match_number, p2, p1, placements[p1.id], lightning,
+                                             is_reload and not reboots_enabled))
+                for hook in elim_hooks:
+                    hook(p1, p2, CONFIG)
 
-                p.loot = min(1.0, p.loot + loot_gain)
+        loot_clock.tick(attacker, defender)
 
         sim_sleep(0.25)
 
+    loot_clock.finish(lobby.alive)
+
     pre_dead_players = [p for p in players if p.id not in placements and not p.alive]
     if pre_dead_players:
 
@@ -2224,34 +2656,49 @@ def simulate_match(players: List[Player], match_number: int):
             placements[p.id] = next_placement
             next_placement -= 1
 
-        print(f"📊 {len(pre_dead_players)} pre-match eliminations assigned bottom placements")
+        sim_print(f"📊 {len(pre_dead_players)} pre-match eliminations assigned bottom placements")
 
-    if not alive:
-        print("No winner — everyone eliminated before end?")
-        return
+    if not lobby.alive:
+        sim_print("No winner — everyone eliminated before end?")
+        return None
 
-    winner = alive[0]
+    winner = lobby.alive[0]
     placements[winner.id] = 1
     winner.alive = True
     if CONFIG["tournament_type"] == "VICTORY_CUP":
         winner.career_victorycup_wins += 1
 
+    players_by_id = {p.id: p for p in players}
+    # First player (in lobby order) holding any grudge against each player, which is who the
+    # "someone else got your rival" check has always credited
+    first_grudge = {}
+    for k in players:
+        for target_id, level in k.rivals.items():
+            if level > 0:
+                first_grudge.setdefault(target_id, k.id)
+
     for p in players:
         for rival_id, rivalry_level in p.rivals.items():
             if rivalry_level >= 5:
-                rival = next((r for r in players if r.id == rival_id), None)
+                rival = players_by_id.get(rival_id)
                 if rival and not p.alive and rival.alive:
                     conf_loss = 0.05 + (rivalry_level - 5) * 0.01
                     p.confidence = max(-1.0, p.confidence - min(0.15, conf_loss))
 
                 elif rival and p.alive and not rival.alive:
-                    rival_killer = next((k for k in players if rival_id in [v.id for v in players if
-                                                                            not v.alive and k.rivals.get(v.id, 0) > 0]),
-                                        None)
-                    if rival_killer and rival_killer.id != p.id:
+                    rival_killer = first_grudge.get(rival_id)
+                    if rival_killer is not None and rival_killer != p.id:
                         conf_loss = 0.03 + (rivalry_level - 5) * 0.005
                         p.confidence = max(-1.0, p.confidence - min(0.1, conf_loss))
 
+    match_result = {
+        "match": match_number,
+        "winner": winner.name,
+        "placements": {},
+        "elims": {},
+        "points": {},
+    }
+
     for p in players:
         placement = placements.get(p.id, len(players))
         elim_count = elims.get(p.id, 0)
@@ -2263,41 +2710,33 @@ def simulate_match(players: List[Player], match_number: int):
             pts = placement_points(placement, t_type) + elim_count * CONFIG["elim_points"]
 
         p.add_match_result(placement, elim_count, pts)
+        match_result["placements"][p.name] = placement
+        match_result["elims"][p.name] = elim_count
+        match_result["points"][p.name] = pts
+
+    standings = rank_players(players)
 
     winner.previous_wins = winner.wins
     commentary = get_victory_commentary(winner, match_number, CONFIG["matches"])
 
-    print("\n" + "━" * 50)
-    print(f"🟩🟩🟩 #1 VICTORY ROYALE - GAME {match_number} 🟩🟩🟩")
-    print("━" * 50)
-    sim_sleep(1)
+    if EVENT_BUS.active:
+        victory_points = 100 if t_type == "VICTORY_CUP" else placement_points(1)
+        EVENT_BUS.emit(VictoryEvent(match_number, winner, elims.get(winner.id, 0), victory_points,
+                                    winner.total_points, commentary))
 
-    print(f"\n🏆 {display_name(winner)}")
-    sim_sleep(0.5)
-    print(f"• Match Kills: {elims.get(winner.id, 0)}")
-    sim_sleep(0.5)
-    if t_type == "VICTORY_CUP":
-        print(f"• Placement Points: 100")
-    else:
-        print(f"• Placement Points: {placement_points(1)}")
+    for hook in MOD_HOOKS.on_match_end:
+        hook(players, winner, CONFIG)
+    for hook in MOD_HOOKS.on_match_end_batch:
+        hook(players, winner, CONFIG)
 
-    sim_sleep(0.5)
-    print(f"• Total Points: {winner.total_points}")
-    sim_sleep(1)
-
-    print(f"\n👑 {Colors.ITALIC}{commentary}{Colors.RESET}\n")
-    sim_sleep(1)
-    print("━" * 50)
-    sim_sleep(1)
-
-    for mod in ACTIVE_MODS:
-        if mod.enabled and hasattr(mod, 'on_match_end'):
-            mod.on_match_end(players, winner, CONFIG)
-
-    update_confidence(players)
+    update_confidence(standings)
     if CONFIG.get("archetype_switching", True):
         for p in players:
             maybe_switch_archetype(p, match_number)
+
+    if quiet:
+        return match_result
+
     print_top10_cumulative(players)
 
     if CONFIG.get("show_win_tickers", True):
@@ -2325,6 +2764,8 @@ def simulate_match(players: List[Player], match_number: int):
     print("·" * 40)
     sim_sleep(1)
 
+    return match_result
+
 
 def walkout_hype(players: List[Player], count=15):
     import random
@@ -2385,11 +2826,7 @@ def walkout_hype(players: List[Player], count=15):
     sim_sleep(2)
 
 
-def simulate_tournament():
-    new_seed = random.randint(1, 1_000_000)
-    CONFIG["random_seed"] = new_seed
-    random.seed(new_seed)
-    save_config(CONFIG)
+def prepare_lobby(social_graph=None, career_data=None):
     pro_players_skills = get_pro_players_from_config()
 
     players = []
@@ -2446,64 +2883,525 @@ def simulate_tournament():
     for i, p in enumerate(players):
         p.id = i
 
-    social_data = load_social_data()
+    global SOCIAL_GRAPH
+    SOCIAL_GRAPH = social_graph if social_graph is not None else SocialGraph.load()
+    SOCIAL_GRAPH.bind(players)
+    name_to_player = {p.name: p for p in players}
 
     for p in players:
         p_key = p.name
 
-        if p_key in social_data.get("friendships", {}):
-            for friend_name, strength in social_data["friendships"][p_key].items():
-                friend = next((other for other in players if other.name == friend_name), None)
-                if friend:
-                    p.friends.add(friend.id)
+        for friend_name, strength in SOCIAL_GRAPH.friendships.get(p_key, {}).items():
+            friend = name_to_player.get(friend_name)
+            if friend:
+                p.friends.add(friend.id)
 
-        if p_key in social_data.get("rivalries", {}):
-            for rival_name, hatred in social_data["rivalries"][p_key].items():
-                rival = next((other for other in players if other.name == rival_name), None)
-                if rival:
-                    p.rivals[rival.id] = hatred
+        for rival_name, hatred in SOCIAL_GRAPH.rivalries.get(p_key, {}).items():
+            rival = name_to_player.get(rival_name)
+            if rival:
+                p.rivals[rival.id] = hatred
 
     for p in players:
         if len(p.friends) < 2:
             num_needed = random.randint(2, 3) - len(p.friends)
-            potential_friends = [other for other in players if other.id != p.id and other.id not in p.friends]
-            if len(potential_friends) >= num_needed:
-                chosen_friends = random.sample(potential_friends, num_needed)
+            available = len(players) - 1 - len(p.friends)
+            if available >= num_needed:
+                chosen_friends = []
+                while len(chosen_friends) < num_needed:
+                    friend = random.choice(players)
+                    if friend.id != p.id and friend.id not in p.friends and friend not in chosen_friends:
+                        chosen_friends.append(friend)
                 for friend in chosen_friends:
                     p.friends.add(friend.id)
                     friend.friends.add(p.id)
 
-    for mod in ACTIVE_MODS:
-        if mod.enabled:
-            mod.on_tournament_start(players, CONFIG)
+    MOD_PROFILER.reset()
+    MOD_HOOKS.rebuild(ACTIVE_MODS, MOD_PROFILER if CONFIG.get("profile_mods", False) else None, batch_mod_hooks())
+    for hook in MOD_HOOKS.on_tournament_start:
+        hook(players, CONFIG)
 
-    load_career_data(players)
+    load_career_data(players, career_data)
 
-    if CONFIG.get("walkouts", False):
-        walkout_hype(players)
+    return players
 
-    for match_number in range(1, CONFIG["matches"] + 1):
-        simulate_match(players, match_number)
+
+def play_matches(players: List[Player], first_match=1):
+    match_results = []
+    for match_number in range(first_match, CONFIG["matches"] + 1):
+        result = simulate_match(players, match_number)
+        if result:
+            match_results.append(result)
 
         if CONFIG.get("archetype_switching", True):
             for p in players:
                 maybe_switch_archetype(p, match_number)
 
+    return match_results
+
+
+def finish_tournament(players: List[Player], persist=True):
     update_careers(players)
-    save_career_data(players)
-    update_social_data(players)
-    print(f"{Colors.LIGHT_GRAY}💾 Career data saved (backup created){Colors.RESET}")
-    init_season_players(players)
-    update_season_stats(players)
+    if persist:
+        save_career_data(players)
+        update_social_data(players)
+        sim_print(f"{Colors.LIGHT_GRAY}💾 Career data saved (backup created){Colors.RESET}")
+        init_season_players(players)
+        update_season_stats(players)
     for p in players:
         p.current_archetype = p.original_archetype
         p.has_switched_archetype = False
-    if SEASON["tournaments_played"] >= SEASON["tournaments_per_season"]:
+    if persist and SEASON["tournaments_played"] >= SEASON["tournaments_per_season"]:
         end_season()
 
+
+def simulate_tournament():
+    new_seed = random.randint(1, 1_000_000)
+    CONFIG["random_seed"] = new_seed
+    random.seed(new_seed)
+    save_config(CONFIG)
+
+    players = prepare_lobby()
+
+    if CONFIG.get("walkouts", False):
+        walkout_hype(players)
+
+    with EVENT_BUS.subscribed(KillfeedRenderer(highlights=CONFIG.get("killfeed_highlights", True))):
+        play_matches(players)
+    close_win_odds_pool()
+    finish_tournament(players)
+
+    if CONFIG.get("profile_mods", False):
+        print_mod_profile()
+        MOD_PROFILER.export_json(MOD_PROFILE_FILE)
+        print(f"📁 Mod timings saved to {MOD_PROFILE_FILE}")
+
     return players
 
 
+def print_mod_profile():
+    stats = MOD_PROFILER.stats()
+    if not stats:
+        print("\nNo mod hooks ran this tournament.")
+        return
+
+    table = Table(title=" MOD TIMINGS ", show_header=True, header_style="bold")
+    table.add_column("Mod")
+    table.add_column("Hook")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("Mean", justify="right")
+    table.add_column("p99", justify="right")
+
+    for row in stats:
+        table.add_row(
+            row["mod"],
+            row["hook"],
+            f"{row['calls']:,}",
+            f"{row['total_us'] / 1000:,.1f} ms",
+            f"{row['mean_us']:.1f} µs",
+            f"{row['p99_us']:.1f} µs"
+        )
+
+    console.print()
+    console.print(table)
+
+
+def run_headless_tournament(seed=None, persist=False, subscribers=(), export=True):
+    """Run a full tournament with no output or pauses and return the results as plain data.
+
+    Event subscribers (a collector, JSONL writer, counter...) can be attached for the run;
+    with none attached no match events are built at all. Career, social and season data
+    are only written with persist=True. With export on, the match data is written in the
+    results_export format and indexed in the tournament archive like any other tournament.
+
+    Like the Monte Carlo runner, each run plays on fresh copies of the mods, so state a mod
+    keeps between tournaments never leaks from one run into the next and a seed always
+    replays the same tournament.
+    """
+    if seed is None:
+        seed = random.randint(1, 1_000_000)
+    random.seed(seed)
+
+    pristine_mods = list(ACTIVE_MODS)
+    ACTIVE_MODS[:] = copy.deepcopy(pristine_mods)
+    try:
+        with headless_mode(), EVENT_BUS.subscribed(*subscribers):
+            players = prepare_lobby()
+            match_results = play_matches(players)
+            finish_tournament(players, persist=persist)
+    finally:
+        ACTIVE_MODS[:] = pristine_mods
+
+    data_file = export_headless_results(players, seed) if export else None
+
+    standings = [
+        {
+            "rank": rank,
+            "name": p.name,
+            "points": p.total_points,
+            "elims": p.total_elims,
+            "wins": p.wins,
+            "average_placement": round(p.average_placement, 2),
+            "earnings": p.tournament_earnings,
+        }
+        for rank, p in enumerate(players, 1)
+    ]
+
+    return {
+        "seed": seed,
+        "tournament_type": CONFIG["tournament_type"],
+        "region": CONFIG.get("region", "EU"),
+        "matches": match_results,
+        "standings": standings,
+        "winner": standings[0]["name"] if standings else None,
+        "mod_profile": MOD_PROFILER.stats() if CONFIG.get("profile_mods", False) else None,
+        "data_file": data_file,
+    }
+
+
+_MONTE_CARLO_STATE = {}
+
+
+def _init_monte_carlo_worker(config, mods, social_data, career_data):
+    CONFIG.clear()
+    CONFIG.update(config)
+    _MONTE_CARLO_STATE["mods"] = mods
+    _MONTE_CARLO_STATE["social_data"] = social_data
+    _MONTE_CARLO_STATE["career_data"] = career_data
+
+
+def _run_monte_carlo_tournament(seed):
+    """Play one headless tournament in a worker and return (name, rank, earnings) per player"""
+    ACTIVE_MODS[:] = copy.deepcopy(_MONTE_CARLO_STATE["mods"])
+    random.seed(seed)
+
+    with headless_mode():
+        players = prepare_lobby(
+            social_graph=SocialGraph(copy.deepcopy(_MONTE_CARLO_STATE["social_data"])),
+            career_data=_MONTE_CARLO_STATE["career_data"]
+        )
+        play_matches(players)
+        finish_tournament(players, persist=False)
+
+    return [(p.name, rank, p.tournament_earnings) for rank, p in enumerate(players, 1)]
+
+
+def _read_region_file(region, filename):
+    path = os.path.join(DATA_DIR, region.lower(), filename)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def run_monte_carlo(runs, template_key=None, region=None, master_seed=None, workers=None):
+    """Play the same tournament setup many times across all CPU cores and summarize the outcomes.
+
+    Every run gets its own seed drawn from master_seed, so the same master seed always gives the
+    same report no matter how many workers are used. Career, season and social files are only
+    read, never written.
+    """
+    if master_seed is None:
+        master_seed = random.randint(1, 1_000_000)
+
+    config = dict(CONFIG)
+    if template_key:
+        template = TOURNAMENT_TEMPLATES[template_key]
+        for key in ("players", "matches", "storm_circles", "elim_points", "tournament_type"):
+            config[key] = template[key]
+    if region:
+        config["region"] = region
+    region = config.get("region", "EU")
+
+    WRITER.flush()
+    social_data = _read_region_file(region, "social_data.json") or {"friendships": {}, "rivalries": {}}
+    # An unmigrated career_stats.json is read as is; moving it into the store is left to the normal load
+    career_data = _read_region_file(region, "career_stats.json")
+    if career_data is None:
+        career_data = CAREER_STORE.export_json(region.lower())
+
+    seed_rng = random.Random(master_seed)
+    seeds = [seed_rng.randrange(2 ** 32) for _ in range(runs)]
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, runs // (workers * 4))
+
+    stats = {}
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_monte_carlo_worker,
+            initargs=(config, ACTIVE_MODS, social_data, career_data)
+    ) as executor:
+        for standings in executor.map(_run_monte_carlo_tournament, seeds, chunksize=chunksize):
+            for name, rank, earnings in standings:
+                s = stats.setdefault(name, {"entries": 0, "wins": 0, "top10": 0, "placement": 0, "earnings": 0})
+                s["entries"] += 1
+                s["wins"] += rank == 1
+                s["top10"] += rank <= 10
+                s["placement"] += rank
+                s["earnings"] += earnings
+
+    players = [
+        {
+            "name": name,
+            "entry_rate": s["entries"] / runs,
+            "win_probability": s["wins"] / s["entries"],
+            "expected_placement": s["placement"] / s["entries"],
+            "top10_rate": s["top10"] / s["entries"],
+            "expected_earnings": s["earnings"] / s["entries"],
+        }
+        for name, s in stats.items()
+    ]
+    players.sort(key=lambda p: (p["win_probability"], -p["expected_placement"]), reverse=True)
+
+    return {
+        "runs": runs,
+        "master_seed": master_seed,
+        "tournament_type": config["tournament_type"],
+        "region": region,
+        "players": players,
+    }
+
+
+WIN_ODDS_POOL = None
+WIN_ODDS_GRACE = 1.0
+
+
+def _win_odds_pool(workers):
+    """The ticker's worker pool, started on first use and kept for the rest of the tournament"""
+    global WIN_ODDS_POOL
+    if WIN_ODDS_POOL is None:
+        WIN_ODDS_POOL = multiprocessing.Pool(processes=workers)
+    return WIN_ODDS_POOL
+
+
+def close_win_odds_pool(terminate=False):
+    """Shut the ticker's pool down; with terminate, runs still going are killed instead of awaited"""
+    global WIN_ODDS_POOL
+    pool, WIN_ODDS_POOL = WIN_ODDS_POOL, None
+    if pool is None:
+        return
+    if terminate:
+        pool.terminate()
+    else:
+        pool.close()
+    pool.join()
+
+
+def _match_state(players):
+    """Copies of the players carrying only what the remaining matches use; the career log is
+    left behind since nothing reads it until the tournament is over"""
+    state = []
+    for p in players:
+        clone = copy.copy(p)
+        clone.career_achievements = AchievementLog()
+        state.append(clone)
+    return state
+
+
+atexit.register(close_win_odds_pool, True)
+
+
+def _simulate_remaining_matches(config, mods, social_graph, players, current_match, seeds, deadline):
+    """Finish a forked tournament once per seed, in order, until the deadline; returns the winners' names"""
+    global SOCIAL_GRAPH
+    CONFIG.clear()
+    CONFIG.update(config)
+    SOCIAL_GRAPH = social_graph
+    winners = []
+
+    for seed in seeds:
+        if time.time() >= deadline:
+            break
+        ACTIVE_MODS[:] = copy.deepcopy(mods)
+        MOD_HOOKS.rebuild(ACTIVE_MODS, batch=batch_mod_hooks())
+        forked = copy.deepcopy(players)
+        random.seed(seed)
+
+        with headless_mode():
+            if CONFIG.get("archetype_switching", True):
+                for p in forked:
+                    maybe_switch_archetype(p, current_match)
+            play_matches(forked, first_match=current_match + 1)
+
+        winners.append(sort_leaderboard(forked)[0].name)
+
+    return winners
+
+
+def simulate_win_chances(players, current_match, runs=None, time_budget=None, workers=None):
+    """Estimate each player's win chance by simulating the rest of the tournament from the current lobby.
+
+    Worker w plays seeds w, w + workers, ... until the time budget runs out. Only the unbroken
+    prefix of the seed list is counted, so the same seed always gives the same odds for the same
+    number of finished runs. Returns (wins by name, runs counted), or None when fewer than
+    win_odds_min_runs finished in time. Seeds come from their own generator so the live
+    tournament's RNG is left untouched.
+    """
+    runs = runs or CONFIG.get("win_odds_runs", 500)
+    time_budget = time_budget or CONFIG.get("win_odds_budget", 2.0)
+    min_runs = min(runs, CONFIG.get("win_odds_min_runs", 10))
+    workers = workers or os.cpu_count() or 1
+
+    seed_rng = random.Random(CONFIG["random_seed"] * 1000 + current_match)
+    seeds = [seed_rng.randrange(2 ** 32) for _ in range(runs)]
+
+    deadline = time.time() + time_budget
+    pool = _win_odds_pool(workers)
+    match_state = _match_state(players)
+    jobs = [
+        pool.apply_async(_simulate_remaining_matches, (dict(CONFIG), ACTIVE_MODS, SOCIAL_GRAPH, match_state,
+                                                       current_match, seeds[w::workers], deadline))
+        for w in range(workers)
+    ]
+    for job in jobs:
+        job.wait(max(0.0, deadline + WIN_ODDS_GRACE - time.time()))
+    if not all(job.ready() for job in jobs):
+        # A run that started just before the deadline is still going; don't let it outlive the ticker
+        close_win_odds_pool(terminate=True)
+
+    results = [job.get() if job.ready() and job.successful() else [] for job in jobs]
+    counted = min(min(w + len(winners) * workers for w, winners in enumerate(results)), runs)
+    if counted < min_runs:
+        return None
+
+    win_counts = {}
+    for w, winners in enumerate(results):
+        for name in winners[:len(range(w, counted, workers))]:
+            win_counts[name] = win_counts.get(name, 0) + 1
+    return win_counts, counted
+
+
+def print_monte_carlo_report(report, limit=25):
+    t_type = report["tournament_type"]
+    console.print("\n" + "━" * 60)
+    console.print(f" 🎲 OUTCOME ODDS — {TOURNAMENT_TYPES[t_type]['label']} ({report['region']})")
+    console.print(f" {report['runs']} runs • master seed {report['master_seed']}")
+    console.print("━" * 60)
+
+    table = Table(show_header=True, header_style=None)
+
+    table.add_column("#", justify="right", width=3)
+    table.add_column("PLAYER", width=12)
+    table.add_column("WIN %", justify="right")
+    table.add_column("AVG PLACE", justify="right")
+    table.add_column("TOP 10 %", justify="right")
+    table.add_column("EXP. EARNINGS", justify="right")
+    table.add_column("ENTERED", justify="right")
+
+    for i, p in enumerate(report["players"][:limit], 1):
+        table.add_row(
+            str(i),
+            p["name"],
+            f"{p['win_probability'] * 100:.1f}%",
+            f"{p['expected_placement']:.1f}",
+            f"{p['top10_rate'] * 100:.1f}%",
+            f"${p['expected_earnings']:,.0f}",
+            f"{p['entry_rate'] * 100:.0f}%"
+        )
+
+    console.print(table)
+    console.print("━" * 60)
+
+
+def monte_carlo_menu():
+    keys = list(TOURNAMENT_TEMPLATES.keys())
+
+    print("\n" + "━" * 45)
+    print("🎲 OUTCOME ODDS (MONTE CARLO)")
+    print("━" * 45)
+    print("0. Current setup")
+    for i, key in enumerate(keys, 1):
+        print(f"{i}. {TOURNAMENT_TEMPLATES[key]['label']}")
+    print("━" * 45)
+
+    choice = input("Setup > ").strip()
+    template_key = None
+    if choice.isdigit() and 1 <= int(choice) <= len(keys):
+        template_key = keys[int(choice) - 1]
+    elif choice != "0":
+        print("Invalid option.")
+        return
+
+    val = input("Number of runs [1000]: ").strip()
+    runs = int(val) if val.isdigit() and int(val) > 0 else 1000
+
+    val = input("Master seed [random]: ").strip()
+    master_seed = int(val) if val.isdigit() else None
+
+    print(f"\n⏳ Simulating {runs} tournaments on {os.cpu_count() or 1} cores...")
+    start = time.time()
+    report = run_monte_carlo(runs, template_key=template_key, master_seed=master_seed)
+    print(f"✅ Done in {time.time() - start:.1f}s")
+    print_monte_carlo_report(report)
+
+
+def tournament_archive_menu():
+    last_results = []
+    while True:
+        print("\n" + "━" * 60)
+        print("🗄️ TOURNAMENT ARCHIVE")
+        print("━" * 60)
+        print("Commands:")
+        print("  find [type=FNCS] [region=EU] [winner=Name] [month=2025-06]")
+        print("  view <#>  → Show a report from the last search")
+        print("  pack      → Bundle reports from previous months")
+        print("  B         → Back")
+        print("━" * 60)
+
+        choice = input("> ").strip()
+        command = choice.lower()
+
+        if command == "b":
+            return
+
+        elif command == "find" or command.startswith("find "):
+            filters = {}
+            for part in choice.split()[1:]:
+                key, _, value = part.partition("=")
+                if key.lower() in ("type", "region", "winner", "month") and value:
+                    filters[key.lower()] = value
+            results = TOURNAMENT_ARCHIVE.find(
+                t_type=filters.get("type"), region=filters.get("region"),
+                winner=filters.get("winner"), month=filters.get("month")
+            )
+
+            if not results:
+                print("No tournaments match.")
+                continue
+
+            table = Table(title=f" {len(results)} TOURNAMENTS ", show_header=True, header_style="bold")
+            table.add_column("#", justify="right")
+            table.add_column("Date")
+            table.add_column("Type")
+            table.add_column("Region")
+            table.add_column("Winner")
+            table.add_column("Seed", justify="right")
+            for i, entry in enumerate(results[-50:], 1):
+                table.add_row(str(i), entry["date"], entry["label"], entry["region"], entry["winner"] or "?",
+                              str(entry["seed"] or "—"))
+            console.print(table)
+            if len(results) > 50:
+                print(f"Showing the latest 50 of {len(results)}.")
+            last_results = results[-50:]
+
+        elif command.startswith("view "):
+            try:
+                entry = last_results[int(command.split()[1]) - 1]
+                print("\n" + TOURNAMENT_ARCHIVE.read(entry["report"] or entry["data"]))
+            except (ValueError, IndexError):
+                print("❌ Search first, then use: view <number>")
+            except OSError as e:
+                print(f"⚠️  Could not read report: {e}")
+
+        elif command == "pack":
+            packed = TOURNAMENT_ARCHIVE.pack()
+            print(f"✅ Packed {packed} file(s) into monthly bundles" if packed else "Nothing old enough to pack.")
+
+        else:
+            print("❌ Unknown command")
+
+
 def sort_leaderboard(players: List[Player]):
     players.sort(
         key=lambda p: (p.total_points, p.wins, p.total_elims, -p.average_placement),
@@ -2555,12 +3453,7 @@ def update_careers(players: List[Player]):
         p.career_earnings += earned
         p.tournament_earnings = earned
         if rank <= 10:
-            p.career_achievements.append({
-                "placement": rank,
-                "type": t_type,
-                "date": datetime.datetime.now().strftime("%Y-%m-%d"),
-                "earnings": earned
-            })
+            p.career_achievements.append(rank, t_type, datetime.datetime.now().strftime("%Y-%m-%d"), earned)
 
         if rank == 1 and t_type != "VICTORY_CUP":
             p.career_wins += 1
@@ -2577,15 +3470,12 @@ def update_careers(players: List[Player]):
 
 
 def update_season_stats(players):
-    for p in players:
-        s = SEASON["season_players"][p.name]
-        s["points"] += p.total_points
-        s["wins"] += p.wins
-        s["elims"] += p.total_elims
-        s["earnings"] += p.tournament_earnings
-
-    SEASON["tournaments_played"] += 1
-    save_season()
+    record = {
+        "seq": SEASON.get("journal_seq", 0) + 1,
+        "players": {p.name: [p.total_points, p.wins, p.total_elims, p.tournament_earnings] for p in players},
+    }
+    apply_season_record(record)
+    WRITER.submit(_append_season_journal, (SEASON_JOURNAL_FILE, json.dumps(record, separators=(",", ":")) + "\n"))
 
 
 def end_season():
@@ -2616,18 +3506,19 @@ def end_season():
         f"{champion} walked so the rest could place 2nd.",
         f"{champion}: still undefeated in vibes."
     ]
-    print("\n" + "━" * 60)
-    print(f"🏁 SEASON {SEASON['current_season']} COMPLETE")
-    print("━" * 60)
-    print(f"👑 MVP: {champion}")
-    print(
+    sim_print("\n" + "━" * 60)
+    sim_print(f"🏁 SEASON {SEASON['current_season']} COMPLETE")
+    sim_print("━" * 60)
+    sim_print(f"👑 MVP: {champion}")
+    sim_print(
         f"⭐ Earnings: ${stats['earnings']:,} | Points: {stats['points']} | Wins: {stats['wins']} | Elims: {stats['elims']}")
-    print(f"   MVP Quote: {random.choice(mvp_quotes)}")
-    print("━" * 60)
+    sim_print(f"   MVP Quote: {random.choice(mvp_quotes)}")
+    sim_print("━" * 60)
     SEASON["current_season"] += 1
     SEASON["tournaments_played"] = 0
     SEASON["season_players"] = {}
     save_season()
+    queue_career_backup()
 
 
 def get_org_players(players, org_name):
@@ -2686,9 +3577,9 @@ def compare_players(p1, p2):
         else:
             return "[red]▼[/]"
 
-    top10 = lambda p: sum(1 for a in getattr(p, "career_achievements", []) if a["placement"] <= 10)
-    top5 = lambda p: sum(1 for a in getattr(p, "career_achievements", []) if a["placement"] <= 5)
-    top3 = lambda p: sum(1 for a in getattr(p, "career_achievements", []) if a["placement"] <= 3)
+    top10 = lambda p: p.career_achievements.count_top(10)
+    top5 = lambda p: p.career_achievements.count_top(5)
+    top3 = lambda p: p.career_achievements.count_top(3)
     dominance = lambda \
             p: p.career_lan_wins * 3 + p.career_fncs_wins * 2 + p.career_cashcup_wins * 1 + p.career_victorycup_wins * 1
     major_ratio = lambda p: (p.career_lan_wins + p.career_fncs_wins) / max(1, (
@@ -2774,6 +3665,7 @@ def show_player_history(players: List[Player]):
             "  • [player name]   → View player profile\n"
             "  • [org name]      → View org page\n"
             "  • career          → Career leaderboard\n"
+            "  • career all      → Every career on record\n"
             "  • season          → Season leaderboard\n"
             "  • goat            → 🐐 GOAT leaderboard\n"
             "  • compare A B     → Compare two players\n"
@@ -2836,6 +3728,10 @@ def show_player_history(players: List[Player]):
             console.print(table)
             continue
 
+        if user_input == "career all":
+            browse_all_careers()
+            continue
+
         if user_input == "career":
             career_players = [p for p in sorted_players if hasattr(p, "career_earnings")]
             if not career_players:
@@ -3032,7 +3928,7 @@ def show_player_history(players: List[Player]):
                     for a in top_achievements:
                         medal = {1: "🥇", 2: "🥈", 3: "🥉", 4: "#4", 5: "#5", 6: "#6", 7: "#7", 8: "#8", 9: "#9",
                                  10: "#10"}.get(a["placement"], "•")
-                        t_label = TOURNAMENT_TYPES[a["type"]]["label"]
+                        t_label = TOURNAMENT_TYPES.get(a["type"], {"label": a["type"]})["label"]
                         print(f"{medal} {t_label} ({a['date']})")
 
             print("─" * 35)
@@ -3044,13 +3940,7 @@ def show_player_history(players: List[Player]):
                 print(f"Season Elims: {s['elims']}")
                 print(f"Season Earnings: ${s['earnings']:,}")
 
-                try:
-                    with open(SEASON_FILE, "r", encoding="utf-8") as f:
-                        season_data = json.load(f)
-                except FileNotFoundError:
-                    season_data = {"history": []}
-                except json.JSONDecodeError:
-                    season_data = {"history": []}
+                season_data = SEASON
 
                 player_prime = {"season": None, "earnings": 0}
 
@@ -3076,6 +3966,79 @@ def show_player_history(players: List[Player]):
                     print(f"🏆 Prime Season: No prime season yet -- keep grinding!")
 
 
+def browse_all_careers(page_size=20):
+    """Page through every career in the region straight from the career store"""
+    WRITER.flush()
+    migrate_career_file()
+    order_by = "earnings"
+    name_filter = None
+    page = 0
+
+    while True:
+        total = CAREER_STORE.count(REGION, name_filter)
+        if total == 0:
+            print("No career data available yet." if not name_filter else f"No careers match '{name_filter}'.")
+            if not name_filter:
+                return
+            name_filter = None
+            continue
+
+        pages = (total + page_size - 1) // page_size
+        page = max(0, min(page, pages - 1))
+        rows = CAREER_STORE.page(REGION, order_by, page * page_size, page_size, name_filter)
+
+        profiles = [Player(id=i, name=name, skill=0) for i, (name, _) in enumerate(rows)]
+        load_career_data(profiles, dict(rows))
+
+        title = f" ALL CAREERS — {REGION.upper()} (by {order_by}) "
+        if name_filter:
+            title += f"[matching '{name_filter}'] "
+        table = Table(title=title)
+
+        table.add_column("Rank", justify="right")
+        table.add_column("Player")
+        table.add_column("Wins", justify="right")
+        table.add_column("Tournaments", justify="right")
+        table.add_column("Kills", justify="right")
+        table.add_column("Earnings", justify="right")
+        table.add_column("Career Tier", justify="right")
+
+        for rank, p in enumerate(profiles, page * page_size + 1):
+            table.add_row(
+                str(rank),
+                p.name,
+                str(p.career_wins),
+                str(p.career_tournaments),
+                str(p.career_kills),
+                f"${p.career_earnings:,}",
+                get_career_tier(p)
+            )
+
+        console.print(table)
+        print(f"Page {page + 1}/{pages} — {total:,} players")
+        choice = input("[n]ext, [p]rev, sort <earnings/kills/wins/tournaments>, find <name>, [b]ack: ").strip().lower()
+
+        if choice == "n":
+            page += 1
+        elif choice == "p":
+            page -= 1
+        elif choice.startswith("sort "):
+            option = choice.split(maxsplit=1)[1]
+            if option in SORTABLE_FIELDS:
+                order_by = option
+                page = 0
+            else:
+                print("Invalid option, keeping the current order.")
+        elif choice.startswith("find "):
+            name_filter = choice.split(maxsplit=1)[1]
+            page = 0
+        elif choice == "find" or choice == "all":
+            name_filter = None
+            page = 0
+        elif choice == "b" or choice == "q":
+            return
+
+
 def get_major_wins(player):
     return player.career_lan_wins + player.career_fncs_wins
 
@@ -3109,30 +4072,7 @@ def get_career_tier(player):
 
 
 def get_top_achievements(player, limit=6):
-    if not hasattr(player, "career_achievements"):
-        return []
-
-    def weight(a):
-        placement_scores = {1: 100, 2: 85, 3: 70, 4: 55, 5: 40}
-        score = placement_scores.get(a["placement"], max(0, 40 - (a["placement"] - 5) * 2))
-
-        type_multiplier = {
-            "LAN": 4,
-            "FNCS": 3,
-            "ELITE_SERIES": 2,
-            "RELOAD": 1.5,
-            "CASH_CUP": 1.0,
-            "VICTORY_CUP": 0.5
-        }
-        score *= type_multiplier.get(a["type"], 1.0)
-
-        return score
-
-    return sorted(
-        player.career_achievements,
-        key=weight,
-        reverse=True
-    )[:limit]
+    return player.career_achievements.highlights(limit)
 
 
 def get_goat_index(p):
@@ -3146,7 +4086,7 @@ def get_goat_index(p):
         p.career_cashcup_wins * 12 +
         p.career_victorycup_wins * 8 +
 
-        sum(1 for a in getattr(p, "career_achievements", []) if a["placement"] <= 10) * 4 +
+        p.career_achievements.count_top(10) * 4 +
 
         min(p.career_earnings / 100_000, 60) +
 
@@ -3189,10 +4129,13 @@ def export_tournament_results(players: List[Player], matches: int):
 
         f.write("MATCH RESULTS\n")
         f.write("─" * 55 + "\n")
+        winners = {}
+        for p in players:
+            for match_num, placement in enumerate(p.placements, 1):
+                if placement == 1:
+                    winners.setdefault(match_num, p.name)
         for match_num in range(1, matches + 1):
-            winners = [p for p in players if p.placements[match_num - 1] == 1]
-            winner = winners[0].name if winners else "Unknown"
-            f.write(f"Game {match_num:<2} → {winner} 👑\n")
+            f.write(f"Game {match_num:<2} → {winners.get(match_num, 'Unknown')} 👑\n")
         f.write("\n")
 
         f.write("─" * 55 + "\n")
@@ -3225,6 +4168,116 @@ def export_tournament_results(players: List[Player], matches: int):
 
     print(f"📁 Tournament results exported to /tournaments/{safe_label}/{filename}")
 
+    data_path = export_match_data(sorted_players, matches, safe_label, filename[:-len(".txt")])
+    if data_path:
+        print(f"📁 Match data exported to /tournaments/{data_path}")
+
+    TOURNAMENT_ARCHIVE.record(t_type, t_label, region, timestamp, mvp.name, CONFIG.get("random_seed"),
+                              f"{safe_label}/{filename}", data_path)
+
+
+def export_headless_results(players: List[Player], seed):
+    """Export a headless run's match data and index it; returns the path, or None when the export is off"""
+    t_type = CONFIG["tournament_type"]
+    t_label = TOURNAMENT_TYPES[t_type]["label"]
+    safe_label = t_label.replace(" ", "")
+    region = CONFIG.get("region", "EU")
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+    sorted_players = sorted(
+        players,
+        key=lambda p: (p.total_points, p.wins, p.total_elims, -p.average_placement),
+        reverse=True
+    )
+    # Many headless runs finish within the same second, so the seed keeps their file names apart
+    data_path = export_match_data(sorted_players, CONFIG["matches"], safe_label,
+                                  f"{safe_label}_{region}_{timestamp}_{seed}", seed)
+    if data_path:
+        TOURNAMENT_ARCHIVE.record(t_type, t_label, region, timestamp, sorted_players[0].name, seed, None, data_path)
+    return data_path
+
+
+def export_match_data(ranked_players, matches, safe_label, stem, seed=None):
+    """Write the machine-readable results into tournaments/<label>/; returns the archive path, or None when off"""
+    data_format = results_export_format()
+    if data_format == "OFF":
+        return None
+    tournament_dir = os.path.join(TOURNAMENTS_ROOT, safe_label)
+    os.makedirs(tournament_dir, exist_ok=True)
+    data_filename = write_results_data(ranked_players, matches, os.path.join(tournament_dir, stem), data_format, seed)
+    return f"{safe_label}/{data_filename}"
+
+
+def results_export_format():
+    data_format = str(CONFIG.get("results_export", "JSONL")).upper()
+    if data_format not in RESULTS_EXPORT_FORMATS:
+        print(f"⚠️  Unknown results_export {data_format!r} in config, using JSONL")
+        return "JSONL"
+    return data_format
+
+
+RESULTS_EXPORT_FORMATS = ["OFF", "JSONL", "JSONL.GZ", "CSV", "CSV.GZ"]
+RESULTS_EXPORT_CONFIG_KEYS = ["players", "matches", "storm_circles", "elim_points", "poi_count", "min_poi_size",
+                              "max_poi_size", "allow_griefing", "archetype_switching",
+                              "batch_mod_hooks"]
+
+
+def write_results_data(ranked_players, matches, base_path, data_format="JSONL", seed=None):
+    """Write every player's per-match placements and elims plus the seed and config in one pass.
+
+    JSONL gets a tournament header line followed by one line per player; CSV gets one row per
+    player with the seed and settings repeated so each row stands alone, and blank cells for
+    matches a player did not finish. Returns the file name.
+    """
+    compress = data_format.endswith(".GZ")
+    kind = data_format.split(".")[0].lower()
+    path = f"{base_path}.{kind}" + (".gz" if compress else "")
+    opener = gzip.open if compress else open
+
+    header = {
+        "type": "tournament",
+        "date": datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S"),
+        "tournament_type": CONFIG["tournament_type"],
+        "region": CONFIG.get("region", "EU"),
+        "seed": CONFIG.get("random_seed") if seed is None else seed,
+        "config": {key: CONFIG.get(key, DEFAULT_CONFIG.get(key)) for key in RESULTS_EXPORT_CONFIG_KEYS},
+        "mods": [mod.name for mod in ACTIVE_MODS if mod.enabled],
+    }
+
+    with opener(path, "wt", encoding="utf-8", newline="") as f:
+        if kind == "jsonl":
+            lines = [json.dumps(header, separators=(",", ":"))]
+            for rank, p in enumerate(ranked_players, 1):
+                lines.append(json.dumps({
+                    "type": "player",
+                    "rank": rank,
+                    "name": p.name,
+                    "org": p.org,
+                    "points": p.total_points,
+                    "elims": p.total_elims,
+                    "wins": p.wins,
+                    "placements": p.placements,
+                    "match_elims": p.match_kills,
+                }, separators=(",", ":"), ensure_ascii=False))
+            f.write("\n".join(lines) + "\n")
+        else:
+            def pad(values):
+                return values + [""] * (matches - len(values))
+
+            writer = csv.writer(f)
+            writer.writerow(
+                ["seed", "tournament_type", "region", "rank", "name", "org", "points", "elims", "wins"]
+                + [f"place_{m}" for m in range(1, matches + 1)]
+                + [f"elims_{m}" for m in range(1, matches + 1)]
+            )
+            writer.writerows(
+                [header["seed"], header["tournament_type"], header["region"], rank, p.name, p.org,
+                 p.total_points, p.total_elims, p.wins] + pad(p.placements) + pad(p.match_kills)
+                for rank, p in enumerate(ranked_players, 1)
+            )
+
+    return os.path.basename(path)
+
 
 def cycle_tournament_type():
     keys = list(TOURNAMENT_TYPES.keys())
@@ -3302,15 +4355,9 @@ def print_season_progress_bar():
 
 def restore_from_backup_menu():
     """Menu for restoring from automatic backups"""
-    backup_dir = os.path.join(REGION_DATA_DIR, "backups")
-
-    if not os.path.exists(backup_dir):
-        print("\n❌ No backups found. Backups are created after each tournament.")
-        input("\nPress Enter to continue...")
-        return
-
-    career_backups = sorted([f for f in os.listdir(backup_dir) if f.startswith("career_stats_backup_")], reverse=True)
-    season_backups = sorted([f for f in os.listdir(backup_dir) if f.startswith("season_data_backup_")], reverse=True)
+    store = get_backup_store()
+    career_backups = career_restore_points(store)
+    season_backups = store.snapshots("season_data")
 
     if not career_backups and not season_backups:
         print("\n❌ No backups found. Backups are created after each tournament.")
@@ -3321,7 +4368,7 @@ def restore_from_backup_menu():
         print("\n" + "━" * 60)
         print("🔄 RESTORE FROM BACKUP")
         print("━" * 60)
-        print(f"\nBackup Location: {backup_dir}")
+        print(f"\nBackup Location: {store.backup_dir}")
         print(f"Career Backups: {len(career_backups)} | Season Backups: {len(season_backups)}")
 
         print("\n⚠️  WARNING: Restoring will overwrite your current data!")
@@ -3333,16 +4380,15 @@ def restore_from_backup_menu():
         if career_backups:
             print("\n💼 CAREER DATA BACKUPS:")
             for i, backup in enumerate(career_backups[:10], 1):
-                timestamp = backup.replace("career_stats_backup_", "").replace(".json", "")
-                print(f"  C{i}. {timestamp}")
+                kind = "full" if backup["kind"] == "career_stats" else "after tournament"
+                print(f"  C{i}. {backup['timestamp']} ({kind})")
             if len(career_backups) > 10:
                 print(f"  ... and {len(career_backups) - 10} more")
 
         if season_backups:
             print("\n📆 SEASON DATA BACKUPS:")
             for i, backup in enumerate(season_backups[:10], 1):
-                timestamp = backup.replace("season_data_backup_", "").replace(".json", "")
-                print(f"  S{i}. {timestamp}")
+                print(f"  S{i}. {backup['timestamp']}")
             if len(season_backups) > 10:
                 print(f"  ... and {len(season_backups) - 10} more")
 
@@ -3363,19 +4409,16 @@ def restore_from_backup_menu():
             try:
                 idx = int(choice.split()[1]) - 1
                 if 0 <= idx < len(career_backups):
-                    backup_file = career_backups[idx]
-                    backup_path = os.path.join(backup_dir, backup_file)
-                    timestamp = backup_file.replace("career_stats_backup_", "").replace(".json", "")
+                    backup = career_backups[idx]
+                    timestamp = backup["timestamp"]
 
                     print(f"\n⚠️  Restore career data from {timestamp}?")
                     print("   Your current career data will be backed up first.")
                     confirm = input("Continue? (y/n): ").strip().lower()
 
                     if confirm == "y":
-                        create_backup(CAREER_FILE, "career_stats")
-
-                        import shutil
-                        shutil.copy2(backup_path, CAREER_FILE)
+                        backup_career_data()
+                        restore_career_backup(backup)
                         print(f"✅ Career data restored from {timestamp}")
                         print("🔄 Please restart the simulator to see changes.")
                         sim_sleep(2)
@@ -3389,9 +4432,8 @@ def restore_from_backup_menu():
             try:
                 idx = int(choice.split()[1]) - 1
                 if 0 <= idx < len(season_backups):
-                    backup_file = season_backups[idx]
-                    backup_path = os.path.join(backup_dir, backup_file)
-                    timestamp = backup_file.replace("season_data_backup_", "").replace(".json", "")
+                    backup = season_backups[idx]
+                    timestamp = backup["timestamp"]
 
                     print(f"\n⚠️  Restore season data from {timestamp}?")
                     print("   Your current season data will be backed up first.")
@@ -3399,9 +4441,7 @@ def restore_from_backup_menu():
 
                     if confirm == "y":
                         save_season()
-
-                        import shutil
-                        shutil.copy2(backup_path, SEASON_FILE)
+                        restore_season_backup(backup)
                         print(f"✅ Season data restored from {timestamp}")
                         print("🔄 Please restart the simulator to see changes.")
                         sim_sleep(2)
@@ -3415,27 +4455,21 @@ def restore_from_backup_menu():
             try:
                 idx = int(choice.split()[1]) - 1
                 if 0 <= idx < min(len(career_backups), len(season_backups)):
-                    career_file = career_backups[idx]
-                    season_file = season_backups[idx]
-                    career_path = os.path.join(backup_dir, career_file)
-                    season_path = os.path.join(backup_dir, season_file)
-
-                    career_time = career_file.replace("career_stats_backup_", "").replace(".json", "")
-                    season_time = season_file.replace("season_data_backup_", "").replace(".json", "")
+                    career_backup = career_backups[idx]
+                    season_backup = season_backups[idx]
 
                     print(f"\n⚠️  Restore both career and season data?")
-                    print(f"   Career backup: {career_time}")
-                    print(f"   Season backup: {season_time}")
+                    print(f"   Career backup: {career_backup['timestamp']}")
+                    print(f"   Season backup: {season_backup['timestamp']}")
                     print("   Current data will be backed up first.")
                     confirm = input("Continue? (y/n): ").strip().lower()
 
                     if confirm == "y":
-                        create_backup(CAREER_FILE, "career_stats")
+                        backup_career_data()
                         save_season()
 
-                        import shutil
-                        shutil.copy2(career_path, CAREER_FILE)
-                        shutil.copy2(season_path, SEASON_FILE)
+                        restore_career_backup(career_backup)
+                        restore_season_backup(season_backup)
                         print(f"✅ Career and season data restored")
                         print("🔄 Please restart the simulator to see changes.")
                         sim_sleep(2)
@@ -3489,6 +4523,7 @@ def save_management_menu():
         print("  D <#>   → Delete Save")
         print("  S       → Save Current Progress")
         print("  RESTORE → Restore from Backup")
+        print("  EXPORT  → Export Careers to JSON")
         print("  B       → Back to Main Menu")
         print("━" * 50)
 
@@ -3518,6 +4553,7 @@ def save_management_menu():
                 sim_sleep(0.8)
 
         elif choice == "s":
+            queue_career_backup()
             save_current_to_file(current)
             print(f"✅ Progress saved to: {current}")
             sim_sleep(0.8)
@@ -3593,6 +4629,15 @@ def save_management_menu():
         elif choice == "restore":
             restore_from_backup_menu()
 
+        elif choice == "export":
+            export_path = os.path.join(REGION_DATA_DIR, "career_stats_export.json")
+            WRITER.flush()
+            with open(export_path, "w", encoding="utf-8") as f:
+                json.dump(CAREER_STORE.export_json(REGION), f, indent=2)
+            print(f"✅ Careers exported to: {export_path}")
+            print("   (Drop a career_stats.json into the region folder to import one)")
+            sim_sleep(0.8)
+
         else:
             print("❌ Unknown command")
             sim_sleep(0.8)
@@ -3913,6 +4958,8 @@ def main_menu():
         print("5. Mods & Extras")
         print("6. Save Management")
         print("7. How to Play")
+        print("8. Outcome Odds (Monte Carlo)")
+        print("9. Tournament Archive")
         print("0. Exit")
         print("━" * 50)
 
@@ -3988,6 +5035,12 @@ def main_menu():
         elif choice == "7":
             how_to_play_guide()
 
+        elif choice == "8":
+            monte_carlo_menu()
+
+        elif choice == "9":
+            tournament_archive_menu()
+
         elif choice == "0":
             current_save = get_current_save()
             save_current_to_file(current_save)
@@ -4021,6 +5074,10 @@ def pre_tournament_menu():
         ticker_status = "ON" if CONFIG.get("show_win_tickers", True) else "OFF"
         print(f"10. WIN TICKERS:         [{ticker_status}]")
         print(f"11. KILLFEED HIGHLIGHTS: [{'ON' if CONFIG.get('killfeed_highlights', False) else 'OFF'}]")
+        print(f"12. SIMULATED WIN ODDS:  [{'ON' if CONFIG.get('simulated_win_odds', False) else 'OFF'}]")
+        print(f"13. MATCH DATA EXPORT:   [{CONFIG.get('results_export', 'JSONL')}]")
+        print(f"14. MOD TIMINGS:         [{'ON' if CONFIG.get('profile_mods', False) else 'OFF'}]")
+        print(f"15. BATCH MOD HOOKS:     [{'ON' if CONFIG.get('batch_mod_hooks', False) else 'OFF'}]")
 
         print(f"0. RESET TO DEFAULT")
         print("\nType a number to change it, or 'B' to return to main menu")
@@ -4046,7 +5103,7 @@ def pre_tournament_menu():
                 CONFIG["players"] = int(val)
                 save_config(CONFIG)
                 if CONFIG["players"] > 100:
-                    print("⚠️  100+ players is not recommended (performance & pacing)")
+                    print("⚠️  100+ players makes for very long killfeeds (use INSTANT speed)")
                 if CONFIG["players"] < 20:
                     print("⚠️  Very low player counts may feel unrealistic")
         elif choice == "2":
@@ -4118,6 +5175,29 @@ def pre_tournament_menu():
             status = "ON" if CONFIG["killfeed_highlights"] else "OFF"
             print(f"Killfeed Top 5 Highlights now {status} (gold glow for leaderboard climbers)")
             save_config(CONFIG)
+        elif choice == "12":
+            CONFIG["simulated_win_odds"] = not CONFIG.get("simulated_win_odds", False)
+            status = "ON" if CONFIG["simulated_win_odds"] else "OFF"
+            print(f"Simulated win odds now {status} (win tickers replay the rest of the tournament)")
+            save_config(CONFIG)
+        elif choice == "13":
+            current = RESULTS_EXPORT_FORMATS.index(results_export_format())
+            CONFIG["results_export"] = RESULTS_EXPORT_FORMATS[(current + 1) % len(RESULTS_EXPORT_FORMATS)]
+            save_config(CONFIG)
+            print(f"📁 Match data export set to {CONFIG['results_export']} (written next to the text report)")
+        elif choice == "14":
+            CONFIG["profile_mods"] = not CONFIG.get("profile_mods", False)
+            status = "ON" if CONFIG["profile_mods"] else "OFF"
+            print(f"Mod timings now {status} (a per-hook cost table is shown after each tournament)")
+            save_config(CONFIG)
+        elif choice == "15":
+            if np is None:
+                print("⚠️ Batch mod hooks need NumPy installed (pip install numpy)")
+                continue
+            CONFIG["batch_mod_hooks"] = not CONFIG.get("batch_mod_hooks", False)
+            status = "ON" if CONFIG["batch_mod_hooks"] else "OFF"
+            print(f"Batch mod hooks now {status} (mods with lobby-wide hooks run them once per match)")
+            save_config(CONFIG)
         else:
             print("Invalid option.")
 
@@ -1,8 +1,48 @@
 if __name__ == "__main__":
     raise RuntimeError("mods.py should not be run directly!")
 
+import importlib
+import json
+import os
 import random
-from utils import display_name, Colors, sim_sleep, CONFIG
+import time
+from array import array
+from utils import display_name, Colors, sim_sleep, sim_print, CONFIG, BASE_DIR
+from events import EVENT_BUS, RageQuitEvent
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class FightModifiers:
+    """Skill adjustments that last for a single fight; the players' own skill is never touched.
+
+    on_fight can return one of these instead of True to let the fight go ahead with the
+    adjusted skills."""
+
+    def __init__(self):
+        self.multipliers = {}
+        self.bonuses = {}
+
+    def scale_skill(self, player, factor):
+        self.multipliers[player.id] = self.multipliers.get(player.id, 1.0) * factor
+        return self
+
+    def add_skill(self, player, amount):
+        self.bonuses[player.id] = self.bonuses.get(player.id, 0.0) + amount
+        return self
+
+    def combine(self, other):
+        for player_id, factor in other.multipliers.items():
+            self.multipliers[player_id] = self.multipliers.get(player_id, 1.0) * factor
+        for player_id, amount in other.bonuses.items():
+            self.bonuses[player_id] = self.bonuses.get(player_id, 0.0) + amount
+        return self
+
+    def skill(self, player):
+        skill = player.skill * self.multipliers.get(player.id, 1.0) + self.bonuses.get(player.id, 0.0)
+        return max(1, min(skill, max(200, player.skill)))
 
 
 class Mod:
@@ -24,6 +64,168 @@ class Mod:
     def on_player_eliminated(self, victim, killer, config):
         pass
 
+    def on_match_end(self, players, winner, config):
+        pass
+
+    def on_player_spawn_batch(self, players, match_number, config):
+        """Lobby-wide on_player_spawn; returns {player_id: "NO_LOAD" or "CRASH"} for the failures"""
+        return {}
+
+    def on_match_end_batch(self, players, winner, config):
+        pass
+
+
+HOOK_NAMES = ("on_tournament_start", "on_match_start", "on_player_spawn", "on_fight", "on_player_eliminated",
+              "on_match_end")
+BATCH_HOOKS = {"on_player_spawn": "on_player_spawn_batch", "on_match_end": "on_match_end_batch"}
+
+
+def batch_rng():
+    """A NumPy generator seeded from the game's random state, so batch draws follow the tournament seed"""
+    return np.random.default_rng(random.getrandbits(64))
+
+
+class HookRegistry:
+    """Per hook, the bound methods of enabled mods that actually override it, in mod order.
+
+    Rebuilt once per tournament so hook sites just loop over a (usually empty) list
+    instead of checking every mod on every fight."""
+
+    def __init__(self, mods=()):
+        self.rebuild(mods)
+
+    def rebuild(self, mods, profiler=None, batch=False):
+        """Collect the hooks again; with a profiler every hook is wrapped to time its calls.
+
+        With batch on, a mod's lobby-wide variant (on_player_spawn_batch, on_match_end_batch)
+        is registered in place of its per-player hook when it has one."""
+        for hook in HOOK_NAMES:
+            batch_hook = BATCH_HOOKS.get(hook)
+            methods = []
+            batch_methods = []
+            for mod in mods:
+                if not mod.enabled:
+                    continue
+                mod = getattr(mod, "instance", mod)
+                if batch and batch_hook and _overrides(mod, batch_hook):
+                    batch_methods.append(self._bind(mod, batch_hook, profiler))
+                elif _overrides(mod, hook):
+                    methods.append(self._bind(mod, hook, profiler))
+            setattr(self, hook, methods)
+            if batch_hook:
+                setattr(self, batch_hook, batch_methods)
+        return self
+
+    @staticmethod
+    def _bind(mod, hook, profiler):
+        method = getattr(mod, hook)
+        return profiler.wrap(mod, hook, method) if profiler else method
+
+
+def _overrides(mod, hook):
+    return getattr(type(mod), hook) is not getattr(Mod, hook)
+
+
+class ModProfiler:
+    """Call counts and timings per mod and hook, gathered by wrapping the registry's hooks"""
+
+    def __init__(self):
+        self.samples = {}
+
+    def reset(self):
+        self.samples = {}
+
+    def wrap(self, mod, hook, method):
+        samples = self.samples.setdefault((mod.name, hook), array("d"))
+        clock = time.perf_counter
+
+        def timed(*args):
+            start = clock()
+            try:
+                return method(*args)
+            finally:
+                samples.append(clock() - start)
+
+        return timed
+
+    def stats(self):
+        """One row per mod and hook, most expensive first; times in microseconds"""
+        rows = []
+        for (mod_name, hook), samples in self.samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            total = sum(ordered)
+            rows.append({
+                "mod": mod_name,
+                "hook": hook,
+                "calls": len(ordered),
+                "total_us": round(total * 1e6, 1),
+                "mean_us": round(total * 1e6 / len(ordered), 2),
+                "p99_us": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e6, 2),
+            })
+        return sorted(rows, key=lambda row: row["total_us"], reverse=True)
+
+    def export_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.stats(), f, indent=2)
+
+
+PLUGINS_DIR = os.path.join(BASE_DIR, "plugins")
+PLUGIN_MANIFEST = os.path.join(PLUGINS_DIR, "manifest.json")
+
+
+class ModPlugin:
+    """One mod listed in plugins/manifest.json.
+
+    The mod's module is only imported, and the mod only created, once it is switched on,
+    so startup stays cheap however many mods the manifest lists."""
+
+    def __init__(self, name, module, cls, description="", options=None):
+        self.name = name
+        self.module = module
+        self.cls = cls
+        self.description = description
+        self.options = options or {}
+        self.instance = None
+        self._enabled = False
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value):
+        if value and self.load() is None:
+            value = False
+        self._enabled = bool(value)
+        if self.instance is not None:
+            self.instance.enabled = self._enabled
+
+    def load(self):
+        if self.instance is None:
+            try:
+                mod_class = getattr(importlib.import_module(self.module), self.cls)
+                self.instance = mod_class(**self.options)
+            except Exception as e:
+                print(f"⚠️  Could not load mod {self.name} ({self.module}.{self.cls}): {e}")
+                return None
+        return self.instance
+
+
+def load_mod_manifest(path=PLUGIN_MANIFEST):
+    """Every mod the manifest lists, as unloaded plugins in manifest order"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)["mods"]
+        return [
+            ModPlugin(e["name"], e["module"], e["class"], e.get("description", ""), e.get("options"))
+            for e in entries
+        ]
+    except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+        print(f"⚠️  Mod manifest {path} missing or invalid ({e}), no mods loaded.")
+        return []
+
 
 class TechnicalIssuesMod(Mod):
     name = "Technical Issues"
@@ -43,6 +245,18 @@ class TechnicalIssuesMod(Mod):
             return "CRASH"
         return None
 
+    def on_player_spawn_batch(self, players, match_number, config):
+        if not self.enabled:
+            return {}
+        rolls = batch_rng().random((len(players), 2))
+        no_load = rolls[:, 0] < self.no_load_chance
+        failed = {}
+        for i in np.flatnonzero(no_load | (rolls[:, 1] < self.crash_chance)):
+            player = players[i]
+            player.alive = False
+            failed[player.id] = "NO_LOAD" if no_load[i] else "CRASH"
+        return failed
+
 
 class RageQuitMod(Mod):
     name = "Rage Quit"
@@ -75,13 +289,44 @@ class RageQuitMod(Mod):
             if avg_bad >= self.tilt_threshold and not getattr(p, '_has_rage_quit', False):
                 chance = min(0.35, self.rage_chance_base * (avg_bad - self.tilt_threshold + 1))
                 if random.random() < chance:
-                    print(f"{Colors.SOFT_RED + Colors.BOLD}😡 {display_name(p)} RAGE QUIT the tournament!{Colors.RESET}")
-                    print(f"   └─ Tilted after {len(streak)} bad games (avg: {avg_bad:.1f})")
-                    sim_sleep(1.5)
+                    if EVENT_BUS.active:
+                        EVENT_BUS.emit(RageQuitEvent(len(p.placements), p, len(streak), avg_bad))
                     p._has_rage_quit = True
 
                     remaining_games = CONFIG["matches"] - len(p.placements)
 
+    def on_match_end_batch(self, players, winner, config):
+        if not self.enabled:
+            return
+
+        players = sorted(players, key=lambda p: p.total_points, reverse=True)
+        count = len(players)
+        ranks = np.arange(1, count + 1)
+        elims = np.fromiter((p.total_elims for p in players), dtype=np.int64, count=count)
+        last_placement = np.fromiter((p.placements[-1] if p.placements else 0 for p in players),
+                                     dtype=np.int64, count=count)
+        quit_already = np.fromiter((getattr(p, '_has_rage_quit', False) for p in players), dtype=bool, count=count)
+
+        badness = 2 * (ranks > count * 0.75) + 2 * (elims < 1) + 2 * (last_placement > 80)
+
+        # Same streak store as on_match_end, so switching hook modes mid-tournament keeps the tilt
+        streaks = [self.player_bad_streaks.setdefault(p.id, []) for p in players]
+        for streak, bad in zip(streaks, badness.tolist()):
+            streak.append(bad)
+            streak[:] = streak[-7:]
+        lengths = np.fromiter((len(s) for s in streaks), dtype=np.int64, count=count)
+        avg_bad = np.fromiter((sum(s) for s in streaks), dtype=np.int64, count=count) / lengths
+
+        chance = np.minimum(0.35, self.rage_chance_base * (avg_bad - self.tilt_threshold + 1))
+        rolls = batch_rng().random(count)
+        quitting = (avg_bad >= self.tilt_threshold) & ~quit_already & (rolls < chance)
+
+        for i in np.flatnonzero(quitting):
+            p = players[i]
+            if EVENT_BUS.active:
+                EVENT_BUS.emit(RageQuitEvent(len(p.placements), p, int(lengths[i]), float(avg_bad[i])))
+            p._has_rage_quit = True
+
 
 class ZeroBuildFlashbackMod(Mod):
     name = "Zero Build Flashback"
@@ -90,9 +335,8 @@ class ZeroBuildFlashbackMod(Mod):
         if not self.enabled:
             return True
         if random.random() < 0.03:
-            print(f"🌀 {attacker.name} is having Zero Build flashbacks! No build fight!")
-            attacker.skill = max(1, attacker.skill * 0.65)
-            defender.skill = min(200, defender.skill * 1.15)
+            sim_print(f"🌀 {attacker.name} is having Zero Build flashbacks! No build fight!")
+            return FightModifiers().scale_skill(attacker, 0.65).scale_skill(defender, 1.15)
         return True
 
 
@@ -103,7 +347,7 @@ class StreamSnipedMod(Mod):
         if not self.enabled:
             return
         if victim.skill >= 100 and random.random() < 0.08:
-            print(f"🎥 {victim.name} just got STREAM-SNIPED by {killer.name}!")
+            sim_print(f"🎥 {victim.name} just got STREAM-SNIPED by {killer.name}!")
             killer.confidence += 0.25
             victim.confidence -= 0.35
 
@@ -118,13 +362,14 @@ class PingDiffMod(Mod):
         if not self.enabled:
             return True
 
+        modifiers = FightModifiers()
         for p in [attacker, defender]:
             if random.random() < self.bad_ping_chance:
                 if random.random() < 0.5:
-                    p.skill = max(1, p.skill * 0.70)
+                    modifiers.scale_skill(p, 0.70)
                 else:
-                    p.skill = min(200, p.skill * 1.18)
-        return True
+                    modifiers.scale_skill(p, 1.18)
+        return modifiers
 
 
 class ClutchFactorMod(Mod):
@@ -153,7 +398,7 @@ class ClutchFactorMod(Mod):
                 else:
                     self.player_clutch_genes[p.id] = "NORMAL"
 
-        print(
+        sim_print(
             f"{Colors.SOFT_CYAN}🎲 Clutch Factor initialized: {clutch_count} clutch players, {choke_count} chokers{Colors.RESET}")
         sim_sleep(1)
 
@@ -169,6 +414,7 @@ class ClutchFactorMod(Mod):
 
         alive_count = len(self.alive_tracking)
         total_matches = config.get("matches", 12)
+        modifiers = FightModifiers()
 
         for p in [attacker, defender]:
             gene = self.player_clutch_genes.get(p.id, "NORMAL")
@@ -189,22 +435,22 @@ class ClutchFactorMod(Mod):
 
             if is_pressure and random.random() < 0.25:
                 if gene == "CLUTCH":
-                    p.skill = min(200, p.skill * 1.30)
+                    modifiers.scale_skill(p, 1.30)
                     p.confidence = min(2.0, p.confidence * 1.12)
                     if random.random() < 0.2:
-                        print(
+                        sim_print(
                             f"{Colors.SOFT_GREEN + Colors.BOLD}💎 {display_name(p)} is LOCKED IN! ({pressure_type}){Colors.RESET}")
                         sim_sleep(0.25)
 
                 elif gene == "CHOKER":
-                    p.skill = max(1, p.skill * 0.68)
+                    modifiers.scale_skill(p, 0.68)
                     p.confidence = max(0.1, p.confidence * 0.82)
                     if random.random() < 0.2:
-                        print(
+                        sim_print(
                             f"{Colors.SOFT_RED}😰 {display_name(p)} is feeling the pressure... ({pressure_type}){Colors.RESET}")
                         sim_sleep(0.25)
 
-        return True
+        return modifiers
 
     def on_player_eliminated(self, victim, killer, config):
         if not self.enabled:
@@ -217,7 +463,7 @@ class ClutchFactorMod(Mod):
         gene = self.player_clutch_genes.get(killer.id, "NORMAL")
 
         if alive_count <= 10 and alive_count > 1 and gene == "CLUTCH" and random.random() < 0.15:
-            print(
+            sim_print(
                 f"{Colors.GOLD + Colors.BOLD}⭐ {display_name(killer)} with the CLUTCH ELIM! (Top {alive_count}){Colors.RESET}")
             killer.confidence = min(2.0, killer.confidence * 1.18)
             sim_sleep(0.25)
\ No newline at end of file
@@ -0,0 +1,86 @@
+if __name__ == "__main__":
+    raise RuntimeError("persistence.py should not be run directly!")
+
+import threading
+import time
+import traceback
+from collections import OrderedDict
+
+
+class BackgroundWriter:
+    """Runs save jobs on a single background thread, strictly in submission order.
+
+    A job submitted under a key that is still waiting replaces the waiting one (or is merged
+    into it) and moves to the back of the queue, so a burst of saves of the same file turns
+    into one write and nothing ever runs before a job that was submitted ahead of it.
+    """
+
+    def __init__(self):
+        self._jobs = OrderedDict()
+        self._running = None
+        self._counter = 0
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="background-writer", daemon=True)
+            self._thread.start()
+
+    def submit(self, fn, data, key=None, merge=None):
+        """Queue fn(data). With a key, a still-queued job under the same key is replaced,
+        or combined with merge(old_data, new_data) when merge is given. Either way it keeps
+        its place in the queue, so it still runs before jobs queued after it."""
+        with self._cond:
+            if key is None:
+                self._counter += 1
+                key = ("job", self._counter)
+            elif key in self._jobs and merge is not None:
+                data = merge(self._jobs[key][1], data)
+            self._jobs[key] = (fn, data)
+            self._ensure_thread()
+            self._cond.notify_all()
+
+    def pending(self, key):
+        """Data of the queued and in-flight jobs under key, oldest first, for reads that must see unsaved writes"""
+        with self._cond:
+            found = []
+            if self._running is not None and self._running[0] == key:
+                found.append(self._running[1])
+            if key in self._jobs:
+                found.append(self._jobs[key][1])
+            return found
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._jobs:
+                    self._cond.wait()
+                key, (fn, data) = self._jobs.popitem(last=False)
+                self._running = (key, data)
+
+            try:
+                fn(data)
+            except Exception:
+                print("⚠️  Background save failed:")
+                traceback.print_exc()
+            finally:
+                with self._cond:
+                    self._running = None
+                    self._cond.notify_all()
+
+    def flush(self, timeout=None):
+        """Block until every job submitted so far has been written.
+
+        If the writer thread died (a job raised KeyboardInterrupt or SystemExit), a new one is
+        started for the jobs still queued. Returns False if the timeout ran out first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._jobs or self._running is not None:
+                if self._jobs and not self._thread.is_alive():
+                    self._ensure_thread()
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(0.5 if remaining is None else min(remaining, 0.5))
+            return True
\ No newline at end of file
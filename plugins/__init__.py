@@ -0,0 +1,2 @@
+# Mod plugins: add a module here and list its mod class in manifest.json.
+# A plugin's module is only imported once its mod is switched on in the Mods menu.
\ No newline at end of file
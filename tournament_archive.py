@@ -0,0 +1,168 @@
+if __name__ == "__main__":
+    raise RuntimeError("tournament_archive.py should not be run directly!")
+
+import datetime
+import gzip
+import json
+import os
+import re
+
+REPORT_NAME = re.compile(r"^(?P<label>.+)_(?P<region>[A-Z]+)_(?P<date>\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})\.txt$")
+
+
+class TournamentArchive:
+    """An append-only index of every exported tournament, plus monthly bundles for old reports.
+
+    index.jsonl holds one line per tournament (type, region, date, winner, seed and where its
+    files live), so lookups never walk the tournaments/ folders. Packing moves old reports and
+    data files into bundles/<YYYY-MM>.gz, one gzip member per file, and records each member's
+    offset and length so a single report can still be read back without unpacking the month.
+    """
+
+    def __init__(self, root, report_labels=None):
+        """report_labels maps the label used in report file names (e.g. "CASHCUP") to its tournament type"""
+        self.root = root
+        self.report_labels = report_labels or {}
+        self.index_file = os.path.join(root, "index.jsonl")
+        self.bundle_dir = os.path.join(root, "bundles")
+
+    def _ensure_index(self, exclude=()):
+        if not os.path.exists(self.index_file):
+            os.makedirs(self.root, exist_ok=True)
+            self._write_index(self._scan_legacy_reports(exclude))
+
+    def _scan_legacy_reports(self, exclude=()):
+        """Index reports exported before the archive existed; their seed was never recorded"""
+        entries = []
+        for folder in sorted(os.listdir(self.root)):
+            folder_path = os.path.join(self.root, folder)
+            if folder == "bundles" or not os.path.isdir(folder_path):
+                continue
+            for filename in sorted(os.listdir(folder_path)):
+                match = REPORT_NAME.match(filename)
+                if not match or f"{folder}/{filename}" in exclude:
+                    continue
+                entry = {
+                    "type": self.report_labels.get(match["label"]),
+                    "label": match["label"],
+                    "region": match["region"],
+                    "date": match["date"],
+                    "winner": None,
+                    "seed": None,
+                    "report": {"path": f"{folder}/{filename}"},
+                    "data": None,
+                }
+                try:
+                    with open(os.path.join(folder_path, filename), "r", encoding="utf-8") as f:
+                        for line in f:
+                            if " finishes 1st with " in line:
+                                entry["winner"] = line.split(" finishes 1st with ")[0].strip()
+                except OSError:
+                    continue
+                entries.append(entry)
+        return entries
+
+    def _write_index(self, entries):
+        tmp_file = self.index_file + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(e, separators=(",", ":"), ensure_ascii=False) + "\n" for e in entries)
+        os.replace(tmp_file, self.index_file)
+
+    def record(self, t_type, label, region, date, winner, seed, report_path, data_path=None):
+        """Append one exported tournament to the index; paths are relative to the archive root.
+
+        Headless runs have no text report, so report_path may be None."""
+        self._ensure_index(exclude={report_path})
+        entry = {
+            "type": t_type,
+            "label": label,
+            "region": region,
+            "date": date,
+            "winner": winner,
+            "seed": seed,
+            "report": {"path": report_path} if report_path else None,
+            "data": {"path": data_path} if data_path else None,
+        }
+        with open(self.index_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, separators=(",", ":"), ensure_ascii=False) + "\n")
+        return entry
+
+    def entries(self):
+        self._ensure_index()
+        with open(self.index_file, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    if entry["type"] is None:
+                        # Indexed from a legacy report name before its type could be worked out
+                        entry["type"] = self.report_labels.get(entry["label"])
+                    yield entry
+
+    def find(self, t_type=None, region=None, winner=None, month=None):
+        """Index entries matching every filter given; label or type both match t_type, winner ignores case"""
+        found = []
+        for entry in self.entries():
+            if t_type and t_type.upper() not in (entry["type"], entry["label"].upper()):
+                continue
+            if region and entry["region"] != region.upper():
+                continue
+            if winner and (entry["winner"] or "").lower() != winner.lower():
+                continue
+            if month and not entry["date"].startswith(month):
+                continue
+            found.append(entry)
+        return found
+
+    def read(self, location):
+        """Contents of an entry's report or data file, wherever it is stored now"""
+        if "bundle" in location:
+            with open(os.path.join(self.root, location["bundle"]), "rb") as f:
+                f.seek(location["offset"])
+                raw = gzip.decompress(f.read(location["length"]))
+        else:
+            with open(os.path.join(self.root, location["path"]), "rb") as f:
+                raw = f.read()
+        if location["path"].endswith(".gz"):
+            raw = gzip.decompress(raw)
+        return raw.decode("utf-8")
+
+    def pack(self, before_month=None):
+        """Move reports from months before before_month (default: this month) into monthly bundles.
+
+        Returns how many files were packed."""
+        before_month = before_month or datetime.date.today().strftime("%Y-%m")
+        entries = list(self.entries())
+        bundles = {}
+        packed = {}
+
+        for entry in entries:
+            month = entry["date"][:7]
+            if month >= before_month:
+                continue
+            for key in ("report", "data"):
+                location = entry[key]
+                if not location or "bundle" in location:
+                    continue
+                source = os.path.join(self.root, location["path"])
+                if source in packed:
+                    location.update(packed[source])
+                    continue
+                if not os.path.exists(source):
+                    continue
+                if month not in bundles:
+                    os.makedirs(self.bundle_dir, exist_ok=True)
+                    bundles[month] = open(os.path.join(self.bundle_dir, f"{month}.gz"), "ab")
+                bundle = bundles[month]
+                with open(source, "rb") as f:
+                    member = gzip.compress(f.read())
+                packed[source] = {"bundle": f"bundles/{month}.gz", "offset": bundle.tell(), "length": len(member)}
+                location.update(packed[source])
+                bundle.write(member)
+
+        for bundle in bundles.values():
+            bundle.close()
+        if packed:
+            self._write_index(entries)
+            for path in packed:
+                os.remove(path)
+        return len(packed)
\ No newline at end of file
@@ -2,6 +2,7 @@ if __name__ == "__main__":
     raise RuntimeError("utils.py should not be run directly!")
 
 import os, json, random, time
+from contextlib import contextmanager
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
@@ -23,9 +24,16 @@ DEFAULT_CONFIG = {
     "region": "EU",
     "tournament_type": "FNCS",
     "show_win_tickers": True,
+    "simulated_win_odds": False,
+    "win_odds_runs": 500,
+    "win_odds_budget": 2.0,
+    "win_odds_min_runs": 10,
     "walkouts": False,
     "killfeed_highlights": False,
     "archetype_switching": True,
+    "results_export": "JSONL",
+    "profile_mods": False,
+    "batch_mod_hooks": False,
     "version": "1.4.0",
     "build": "Rivalry & Strategy Update",
 }
@@ -177,12 +185,103 @@ class Colors:
     SOFT_GOLD = "\033[38;2;240;200;100m"
 
 
+_HEADLESS = False
+
+
+def is_headless():
+    return _HEADLESS
+
+
+@contextmanager
+def headless_mode():
+    """Silence all simulation output and pauses for the duration of the block"""
+    global _HEADLESS
+    previous = _HEADLESS
+    _HEADLESS = True
+    try:
+        yield
+    finally:
+        _HEADLESS = previous
+
+
+def sim_print(*args, **kwargs):
+    if not _HEADLESS:
+        print(*args, **kwargs)
+
+
 def sim_sleep(seconds):
-    if CONFIG["speed"] == "INSTANT":
+    if _HEADLESS or CONFIG["speed"] == "INSTANT":
         return
     elif CONFIG["speed"] == "FAST":
         time.sleep(seconds * 0.65)
     elif CONFIG["speed"] == "SLOW":
         time.sleep(seconds * 1.35)
     else:
-        time.sleep(seconds)
\ No newline at end of file
+        time.sleep(seconds)
+
+
+class WeightedSampler:
+    """Fenwick tree over item weights: O(log n) updates, prefix sums and weighted draws"""
+
+    def __init__(self, weights):
+        self.size = len(weights)
+        self.weights = [float(w) for w in weights]
+        self.tree = [0.0] * (self.size + 1)
+
+        for i, w in enumerate(self.weights, 1):
+            self.tree[i] += w
+            parent = i + (i & -i)
+            if parent <= self.size:
+                self.tree[parent] += self.tree[i]
+
+        self._top_step = 1 << (self.size.bit_length() - 1) if self.size else 0
+
+    def update(self, index, weight):
+        delta = weight - self.weights[index]
+        if delta == 0:
+            return
+        self.weights[index] = weight
+        i = index + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def remove(self, index):
+        self.update(index, 0.0)
+
+    def prefix_sum(self, count):
+        """Sum of the first `count` weights"""
+        total = 0.0
+        i = count
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    @property
+    def total(self):
+        return self.prefix_sum(self.size)
+
+    def find(self, target):
+        """Index of the item whose cumulative weight range contains target"""
+        pos = 0
+        step = self._top_step
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and self.tree[nxt] <= target:
+                pos = nxt
+                target -= self.tree[nxt]
+            step >>= 1
+
+        if pos >= self.size or self.weights[pos] <= 0:
+            # Float drift can land on a boundary or an emptied slot; fall back to the nearest live item
+            for index in range(min(pos, self.size - 1), -1, -1):
+                if self.weights[index] > 0:
+                    return index
+            for index in range(pos, self.size):
+                if self.weights[index] > 0:
+                    return index
+        return pos
+
+    def sample(self):
+        return self.find(random.random() * self.total)
\ No newline at end of file